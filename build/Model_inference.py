@@ -1,54 +1,246 @@
-import pandas as pd
 import joblib
 import numpy as np
 import sys
 import os
+import threading
+import time
+from datetime import datetime
+from collections import defaultdict
+
+from ledger import get_ledger, atomic_write_text
+
+
+MODEL_DIR = os.path.dirname(os.path.abspath(__file__))
+MODEL_PATH = os.path.join(MODEL_DIR, 'expense_necessity_model.joblib')
+CATEGORY_ENCODER_PATH = os.path.join(MODEL_DIR, 'category_encoder.joblib')
+NECESSITY_ENCODER_PATH = os.path.join(MODEL_DIR, 'necessity_encoder.joblib')
+
+OUTPUT_HEADER = ['Date', 'Category', 'Cost', 'DayOfWeek', 'Necessity']
+
+# Necessity written for rows the model can't score, e.g. categories the encoder never saw
+UNKNOWN_NECESSITY = 'Unknown'
+
+
+def row_key(date_str, category, cost):
+    """Content key of an expense row; cost is normalised so 50, 50.0 and $50 match."""
+    try:
+        cost = repr(float(str(cost).replace('$', '').replace(',', '').strip()))
+    except ValueError:
+        cost = str(cost).strip()
+    return (date_str.strip(), category.strip(), cost)
+
+
+def day_of_week(date_str):
+    # Same Monday=0 numbering as pandas' dt.dayofweek
+    try:
+        return datetime.strptime(date_str.strip(), '%m/%d/%Y').weekday()
+    except ValueError:
+        import pandas as pd  # Only needed for dates not in M/D/YYYY form
+        return int(pd.to_datetime(date_str).dayofweek)
+
+
+def safe_day_of_week(date_str):
+    try:
+        return day_of_week(date_str)
+    except ValueError:
+        return ''
+
+
+class Predictor:
+    """Keeps the necessity model and encoders loaded and scores only rows it hasn't seen.
+
+    Predictions are cached by row content (see row_key). The predictions CSV acts as the
+    persistent cache: rows already in it are reused, new rows are scored together in one
+    model.predict call, and only added/removed rows are written back through its ledger.
+    """
+
+    def __init__(self, model_path=MODEL_PATH, category_encoder_path=CATEGORY_ENCODER_PATH,
+                 necessity_encoder_path=NECESSITY_ENCODER_PATH):
+        self.model_path = model_path
+        self.category_encoder_path = category_encoder_path
+        self.necessity_encoder_path = necessity_encoder_path
+        self.model = None
+        self.le_category = None
+        self.le_necessity = None
+        self.category_codes = {}
+        self.cache = {}  # row_key -> Necessity
+        self._model_stamp = None
+        self._lock = threading.RLock()
+        self.counters = {
+            'hits': 0,
+            'misses': 0,
+            'unseen_categories': 0,
+            'predict_calls': 0,
+            'load_seconds': 0.0,
+            'last_latency': 0.0,
+            'total_latency': 0.0,
+            'runs': 0,
+        }
+
+    def _stamp(self):
+        return tuple(os.stat(path).st_mtime_ns for path in
+                     (self.model_path, self.category_encoder_path, self.necessity_encoder_path))
+
+    def load(self):
+        """Load the model and encoders, again only if the files changed on disk."""
+        with self._lock:
+            stamp = self._stamp()
+            if self.model is not None and stamp == self._model_stamp:
+                return
+            start = time.perf_counter()
+            self.model = joblib.load(self.model_path)
+            self.le_category = joblib.load(self.category_encoder_path)
+            self.le_necessity = joblib.load(self.necessity_encoder_path)
+            self.category_codes = {category: code for code, category in enumerate(self.le_category.classes_)}
+            if self._model_stamp is not None:
+                self.cache.clear()  # Predictions from the old model no longer apply
+            self._model_stamp = stamp
+            self.counters['load_seconds'] += time.perf_counter() - start
+
+    def predict_rows(self, rows):
+        """Necessity labels for (date, category, cost) tuples, scoring cache misses in one batch."""
+        labels = [None] * len(rows)
+        pending = []
+        for i, (date_str, category, cost) in enumerate(rows):
+            key = row_key(date_str, category, cost)
+            label = self.cache.get(key)
+            if label is not None:
+                self.counters['hits'] += 1
+                labels[i] = label
+                continue
+            self.counters['misses'] += 1
+            code = self.category_codes.get(category.strip())
+            if code is None:
+                # le_category.transform would raise on this; keep the row and flag it instead
+                self.counters['unseen_categories'] += 1
+                print(f"Warning: Unseen category '{category}', marking as {UNKNOWN_NECESSITY}")
+                labels[i] = self.cache[key] = UNKNOWN_NECESSITY
+                continue
+            try:
+                features = (day_of_week(date_str), code, float(key[2]))
+            except ValueError:
+                print(f"Warning: Could not parse row '{date_str}, {category}, {cost}'")
+                labels[i] = UNKNOWN_NECESSITY
+                continue
+            pending.append((i, key, features))
+
+        if pending:
+            X = np.array([features for _, _, features in pending], dtype=float)
+            predictions = self.le_necessity.inverse_transform(self.model.predict(X))
+            self.counters['predict_calls'] += 1
+            for (i, key, _), label in zip(pending, predictions):
+                labels[i] = self.cache[key] = str(label)
+        return labels
+
+    def predict_on_csv(self, input_csv_path, output_csv_path=None):
+        with self._lock:
+            start = time.perf_counter()
+            self.load()
+
+            if output_csv_path is None:
+                output_csv_path = input_csv_path.replace('_data.csv', 's_predictions.csv')
+
+            source = get_ledger(input_csv_path).rows()
+            header = source[0]
+            date_index = header.index('Date')
+            category_index = header.index('Category')
+            cost_index = header.index('Cost')
+            rows = [(row[date_index], row[category_index], row[cost_index]) for row in source[1:]]
+
+            output = get_ledger(output_csv_path, OUTPUT_HEADER)
+            model_changed = self._seed_cache(output)
+            labels = self.predict_rows(rows)
+            wanted = [[date_str, category, cost, safe_day_of_week(date_str), label]
+                      for (date_str, category, cost), label in zip(rows, labels)]
+
+            if model_changed or output.header != OUTPUT_HEADER:
+                output.replace_all(OUTPUT_HEADER, wanted)
+            else:
+                self._write_delta(output, wanted)
+            # Only once the output holds this model's predictions, so a failed re-score
+            # is retried instead of trusting the old rows
+            atomic_write_text(self._stamp_path(output), ' '.join(self._current_stamp()))
+
+            latency = time.perf_counter() - start
+            self.counters['last_latency'] = latency
+            self.counters['total_latency'] += latency
+            self.counters['runs'] += 1
+            return output_csv_path
+
+    def _stamp_path(self, output):
+        base = os.path.splitext(os.path.basename(output.csv_path))[0]
+        return os.path.join(output.ledger_dir, f"{base}.model.stamp")
+
+    def _current_stamp(self):
+        return tuple(str(part) for part in self._model_stamp)
+
+    def _seed_cache(self, output):
+        # Rows already in the predictions file are cached predictions from an earlier run.
+        # Returns True when they were made by a different model and must be re-scored.
+        meta_path = self._stamp_path(output)
+        saved_stamp = None
+        if os.path.exists(meta_path):
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                saved_stamp = tuple(f.read().split())
+        if saved_stamp is not None and saved_stamp != self._current_stamp():
+            return True
+
+        if output.header != OUTPUT_HEADER:
+            return False
+        for _, row in output.items():
+            if len(row) >= len(OUTPUT_HEADER):
+                self.cache.setdefault(row_key(row[0], row[1], row[2]), row[4])
+        return False
+
+    def _write_delta(self, output, wanted):
+        # Multiset diff between current and wanted output rows; unchanged rows are left alone
+        existing = defaultdict(list)
+        for row_id, row in output.items():
+            existing[tuple(row[:5])].append(row_id)
+        to_add = []
+        for row in wanted:
+            ids = existing.get(tuple(str(value) for value in row))
+            if ids:
+                ids.pop()
+            else:
+                to_add.append(row)
+        to_delete = [row_id for ids in existing.values() for row_id in ids]
+        output.delete_many(to_delete)
+        output.add_many(to_add)
+
+    def stats(self):
+        stats = dict(self.counters)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        stats['cached_rows'] = len(self.cache)
+        return stats
+
+
+_predictor = None
+_predictor_lock = threading.Lock()  # the warm-up thread and the Tk thread may both ask first
+
+
+def get_predictor():
+    """The process-wide Predictor, created on first use."""
+    global _predictor
+    with _predictor_lock:
+        if _predictor is None:
+            _predictor = Predictor()
+        return _predictor
 
 
 def predict_on_csv(input_csv_path, output_csv_path=None):
-    
-    #Load a CSV file, make necessity predictions, and save results
-    
+
+    #Make necessity predictions for a CSV file and save results
+
     #Args:
         #input_csv_path (str): Path to input CSV with Date, Category, Cost columns
         #output_csv_path (str): Path to save results. If None, will modify input filename
-    
+
     #Returns:
         #str: Path to the saved CSV file with predictions
-    
-    # Load the model and encoders
-    model = joblib.load('expense_necessity_model.joblib')
-    le_category = joblib.load('category_encoder.joblib')
-    le_necessity = joblib.load('necessity_encoder.joblib')
-    
-    # Read the input CSV
-    df = pd.read_csv(input_csv_path)
-    
-    # Convert date to day of week
-    df['DayOfWeek'] = pd.to_datetime(df['Date']).dt.dayofweek
-    
-    # Encode categories
-    df['Category_encoded'] = le_category.transform(df['Category'])
-    
-    # Prepare features for prediction
-    X = df[['DayOfWeek', 'Category_encoded', 'Cost']].values
-    
-    # Make predictions
-    predictions = model.predict(X)
-    
-    # Convert predictions back to Yes/No
-    df['Necessity'] = le_necessity.inverse_transform(predictions)
-    
-    # Remove temporary column
-    df = df.drop('Category_encoded', axis=1)
-    
-    # Determine output path
-    if output_csv_path is None:
-        output_csv_path = input_csv_path.replace('_data.csv', 's_predictions.csv')
-    
-    # Save results
-    df.to_csv(output_csv_path, index=False)
-    return output_csv_path
+
+    return get_predictor().predict_on_csv(input_csv_path, output_csv_path)
 
 
 
@@ -64,4 +256,3 @@ def predict_on_csv(input_csv_path, output_csv_path=None):
 """input_file = "DBs\expense_data.csv"
 output_file = predict_on_csv(input_file)
 print(f"Predictions saved to: {output_file}")"""
-
@@ -5,7 +5,7 @@ import time
 import Model_inference as ssai
 run_model = True
 if run_model:
-    input_file = "DBs\expense_data.csv"
+    input_file = "DBs/expense_data.csv"
     output_file = ssai.predict_on_csv(input_file)
     print(f"Predictions saved to: {output_file}")
     time.sleep(1)
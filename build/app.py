@@ -0,0 +1,159 @@
+import startup_profile  # first, so its clock starts before the other imports
+import sys
+import threading
+import tkinter as tk
+from pathlib import Path
+from tkinter import PhotoImage
+
+from data_store import DataStore
+
+startup_profile.mark("app imports done")
+
+
+OUTPUT_PATH = Path(__file__).parent
+
+# Heavy modules loaded in the background once the first screen has painted
+WARM_UP_MODULES = (
+    "matplotlib",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_agg",
+    "numpy",
+    "pandas",
+    "joblib",
+    "sklearn",
+    "Model_inference",
+)
+
+# Screen name -> module exposing build(app) -> Frame
+SCREENS = {
+    "gui": "gui",
+    "gui1": "gui1",
+    "gui2": "gui2",
+    "gui3": "gui3",
+    "gui4": "gui4",
+    "gui5": "gui5",
+    "gui6": "gui6",
+}
+
+
+class AssetCache:
+    """Loads each PhotoImage once for the lifetime of the app."""
+
+    def __init__(self, master):
+        self.master = master
+        self._images = {}
+
+    def image(self, path):
+        key = str(path)
+        image = self._images.get(key)
+        if image is None:
+            image = PhotoImage(master=self.master, file=key)
+            self._images[key] = image
+        return image
+
+
+class App:
+    """Single Tk process hosting every screen as a Frame, switched by show()."""
+
+    def __init__(self, root=None, profile_out=None):
+        self.profile_out = profile_out  # JSON path for the startup timings, written after warm-up
+        self.root = root or tk.Tk()
+        self.root.geometry("1920x1080+0+0")
+        self.root.configure(bg="#FFFFFF")
+        self.root.title("SmartSaver")
+        self.root.resizable(False, False)
+        self.assets = AssetCache(self.root)
+        self.data = DataStore()
+        self.frames = {}
+        self.current = None
+        self.warm_up_thread = None
+        self._painted = False
+        startup_profile.mark("Tk root created")
+
+    def image(self, path):
+        return self.assets.image(path)
+
+    def frame(self, name):
+        # Screens are imported and built the first time they are shown, then kept
+        frame = self.frames.get(name)
+        if frame is None:
+            module = startup_profile.timed_import(SCREENS[name])
+            frame = module.build(self)
+            frame.place(x=0, y=0, relwidth=1, relheight=1)
+            self.frames[name] = frame
+        return frame
+
+    def show(self, name):
+        """Route to a screen by name (e.g. "gui1") or by its script file name ("gui1.py")."""
+        name = Path(name).stem
+        frame = self.frame(name)
+        frame.tkraise()
+        self.current = name
+        on_show = getattr(frame, "on_show", None)
+        if on_show is not None:
+            on_show()
+        return frame
+
+    def _on_first_map(self):
+        # <Map> comes before the redraw; flush pending draws, then let the Expose-driven
+        # ones run before first paint is marked and the warm-up starts
+        if self._painted:
+            return
+        self._painted = True
+        self.root.update_idletasks()
+        self.root.after(0, self._first_paint)
+
+    def _first_paint(self):
+        self.root.update_idletasks()
+        startup_profile.mark("first paint")
+        startup_profile.print_report()
+        self.warm_up_thread = threading.Thread(target=self.warm_up, name="warm-up", daemon=True)
+        self.warm_up_thread.start()
+
+    def warm_up(self):
+        """Import the chart and model stacks and load the model before the user asks for them."""
+        for name in WARM_UP_MODULES:
+            try:
+                startup_profile.timed_import(name)
+            except Exception as e:  # Missing optional packages only matter when the feature is used
+                print(f"Warning: warm-up could not import {name}: {e}")
+        if "Model_inference" in sys.modules:
+            try:
+                sys.modules["Model_inference"].get_predictor().load()
+                startup_profile.mark("model loaded")
+            except Exception as e:
+                print(f"Warning: warm-up could not load the model: {e}")
+        startup_profile.mark("warm-up done")
+        startup_profile.print_report()
+        if self.profile_out:
+            startup_profile.write_report(self.profile_out)
+
+    def run(self, start="gui"):
+        frame = self.show(start)
+        startup_profile.mark(f"screen {start} built")
+        frame.bind("<Map>", lambda event: self._on_first_map(), add="+")
+        self.root.mainloop()
+
+
+def parse_args(argv):
+    """(other arguments, --profile-out path or None) from a command line."""
+    args = [arg for arg in argv if arg != "--profile"]
+    profile_out = None
+    if "--profile-out" in args:
+        i = args.index("--profile-out")
+        profile_out = args[i + 1] if i + 1 < len(args) else "startup_profile.json"
+        del args[i:i + 2]
+    return args, profile_out
+
+
+def main(start="gui", profile_out=None):
+    # guiN.py entry points call main(screen), so pick up --profile-out here too
+    if profile_out is None:
+        _, profile_out = parse_args(sys.argv[1:])
+    App(profile_out=profile_out).run(start)
+
+
+if __name__ == "__main__":
+    # python app.py [screen] [--profile] [--profile-out timings.json]
+    args, profile_out = parse_args(sys.argv[1:])
+    main(args[0] if args else "gui", profile_out)
@@ -0,0 +1,50 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+MAX_WORKERS = 2
+
+# How often the Tk thread checks a pending job, in milliseconds
+POLL_MS = 15
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_executor():
+    """The shared worker pool, created on first use."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=MAX_WORKERS, thread_name_prefix="smartsaver")
+        return _executor
+
+
+def run_in_background(widget, func, on_done, *args, on_error=None):
+    """Run func(*args) on the worker pool and hand its result to on_done on the Tk thread.
+
+    Workers never touch Tk: the Tk side polls the future with widget.after() and calls
+    on_done(result) (or on_error(exception)) from the event loop. Nothing is delivered
+    if the widget has been destroyed in the meantime.
+    """
+    future = get_executor().submit(func, *args)
+
+    def poll():
+        try:
+            if not widget.winfo_exists():
+                return
+        except Exception:
+            return  # The Tk app itself is gone
+        if not future.done():
+            widget.after(POLL_MS, poll)
+            return
+        error = future.exception()
+        if error is None:
+            on_done(future.result())
+        elif on_error is not None:
+            on_error(error)
+        else:
+            print(f"Error in background task {getattr(func, '__name__', func)}: {error}")
+
+    widget.after(POLL_MS, poll)
+    return future
@@ -0,0 +1,332 @@
+import os
+
+# Tk-free: nothing here opens a window, and charts (if any) would use Agg
+os.environ.setdefault("MPLBACKEND", "Agg")
+
+import argparse
+import gc
+import json
+import platform
+import shutil
+import statistics
+import sys
+import time
+import tkinter
+import tracemalloc
+from datetime import datetime
+
+import FE_FriendlyMain
+import data_store
+import ledger
+import projection
+import rollup
+import tx_store
+from synthetic_data import DEFAULT_OUT_DIR, ensure_dataset
+
+
+DEFAULT_SIZES = (10_000, 100_000, 1_000_000)
+DEFAULT_REPEAT = 3
+
+# A result regresses when it is this many times its baseline value...
+DEFAULT_THRESHOLD = 1.5
+# ...and worse by more than these absolute amounts, so timer noise on tiny numbers doesn't count
+MIN_REGRESSION_SECONDS = 0.005
+MIN_REGRESSION_MIB = 1.0
+
+# The app's own files; benchmarking wipes the ledger in --data-dir, so a folder holding these is refused
+APP_CSV_NAMES = tuple(os.path.basename(path) for path in (data_store.EXPENSE_FILE, data_store.INCOME_FILE,
+                                                          data_store.PREDICTIONS_FILE))
+
+# Data-path functions, which all need the generated CSVs read first
+DATA_CASES = ("read_csv_data_list", "read_csv_data_list[income]", "SortIndex", "SortIndex.view[price]",
+              "SortIndex.view[category]", "Rollup", "analyze_spending", "get_available_weeks", "potential_savings",
+              "savings_projection")
+
+# Savings grid benchmarked next to the window's own 12-month projection
+PROJECTION_RATES = tuple(i / 1000 for i in range(51))  # 0% to 5% monthly
+PROJECTION_HORIZONS = range(1, 121)
+
+
+class ConsoleMessages:
+    """Stands in for tkinter.messagebox so error paths print instead of opening a Tk root."""
+
+    def showerror(self, title, message):
+        print(f"{title}: {message}")
+
+    showinfo = showwarning = showerror
+
+    def askyesno(self, title, message):
+        return False
+
+
+def clear_index_caches():
+    # Parsed stores, sort indexes and projections are all built once per data list
+    tx_store._stores.clear()
+    tx_store._sort_indexes.clear()
+    projection._projections.clear()
+
+
+def clear_rollups(data_dir):
+    with rollup._rollups_lock:
+        rollup._rollups.clear()
+    # Rollups are the ledgers' only listeners; drop the forgotten ones with them
+    prefix = os.path.abspath(data_dir) + os.sep
+    with ledger._ledgers_lock:
+        for key, data_ledger in ledger._ledgers.items():
+            if key.startswith(prefix):
+                data_ledger._listeners.clear()
+    ledger_dir = os.path.join(data_dir, ledger.LEDGER_DIR_NAME)
+    for name in os.listdir(ledger_dir) if os.path.isdir(ledger_dir) else ():
+        if name.endswith(".rollup.json"):
+            os.remove(os.path.join(ledger_dir, name))
+
+
+def clear_ledgers(data_dir):
+    """Forget every ledger and its files in data_dir, so the next read imports the CSV."""
+    prefix = os.path.abspath(data_dir) + os.sep
+    with ledger._ledgers_lock:
+        for key in [key for key in ledger._ledgers if key.startswith(prefix)]:
+            del ledger._ledgers[key]
+    shutil.rmtree(os.path.join(data_dir, ledger.LEDGER_DIR_NAME), ignore_errors=True)
+    clear_rollups(data_dir)
+    clear_index_caches()
+
+
+def measure(run, reset, repeat):
+    """Cold time (after reset), median and best warm time over repeat runs, and cold peak memory."""
+    reset()
+    gc.collect()
+    start = time.perf_counter()
+    run()
+    cold = time.perf_counter() - start
+
+    warm = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        warm.append(time.perf_counter() - start)
+
+    # Memory is traced in its own cold run, since tracemalloc slows everything down
+    reset()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "cold_s": cold,
+        "warm_s": statistics.median(warm) if warm else None,
+        "warm_min_s": min(warm) if warm else None,
+        "peak_mib": peak / 2**20,
+    }
+
+
+def predictor_case(expense_path, output_path):
+    """(run, reset) for Model_inference.predict_on_csv, or a reason it can't run here."""
+    try:
+        import Model_inference
+    except ImportError as e:
+        return f"Model_inference unavailable: {e}"
+    if not all(os.path.exists(path) for path in (Model_inference.MODEL_PATH, Model_inference.CATEGORY_ENCODER_PATH,
+                                                 Model_inference.NECESSITY_ENCODER_PATH)):
+        return "model files not found"
+
+    state = {}
+
+    def reset():
+        # A fresh predictor (model load, empty cache) and no previous output, including
+        # its ledger files and model stamp, or the next run would re-export the old rows
+        state["predictor"] = Model_inference.Predictor()
+        with ledger._ledgers_lock:
+            ledger._ledgers.pop(os.path.abspath(output_path), None)
+        if os.path.exists(output_path):
+            os.remove(output_path)
+        ledger_dir = os.path.join(os.path.dirname(os.path.abspath(output_path)), ledger.LEDGER_DIR_NAME)
+        prefix = os.path.splitext(os.path.basename(output_path))[0] + "."
+        for name in os.listdir(ledger_dir) if os.path.isdir(ledger_dir) else ():
+            if name.startswith(prefix):
+                os.remove(os.path.join(ledger_dir, name))
+
+    def run():
+        state["predictor"].predict_on_csv(expense_path, output_path)
+
+    return run, reset
+
+
+def data_cases(data_dir, expense_path, income_path, wanted):
+    """(function name, run, reset) for the wanted data-path functions."""
+    # Everything after the read works on the already-loaded rows, as the screens do
+    clear_ledgers(data_dir)
+    data = FE_FriendlyMain.read_csv_data_list(expense_path)
+    latest_month = tx_store.get_store(data).months()[0]
+    year, month = map(int, latest_month.split('-'))
+    month_start = datetime(year, month, 1)
+    month_end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+
+    def reset_savings():
+        clear_index_caches()
+        clear_rollups(data_dir)
+
+    def sort_view(sort_option, category="All"):
+        # Only the view: the keys are indexed once and the cached views dropped before each run
+        def run():
+            index = tx_store.get_sort_index(data)
+            index._permutations.clear()
+            index._views.clear()
+            index.view(sort_option, category)
+        return run
+
+    sort_index = tx_store.get_sort_index(data)
+    largest_category = max(sort_index.category_rows, key=lambda name: len(sort_index.category_rows[name]))
+
+    all_cases = (
+        ("read_csv_data_list", lambda: FE_FriendlyMain.read_csv_data_list(expense_path),
+         lambda: clear_ledgers(data_dir)),
+        ("read_csv_data_list[income]", lambda: FE_FriendlyMain.read_csv_data_list(income_path),
+         lambda: clear_ledgers(data_dir)),
+        ("SortIndex", lambda: tx_store.SortIndex(data), lambda: None),
+        ("SortIndex.view[price]", sort_view("Price: High to Low"), lambda: None),
+        ("SortIndex.view[category]", sort_view("Date: Most Recent to Least Recent", largest_category), lambda: None),
+        # Cold is a full count of the rows; warm runs load the cube the cold run saved
+        ("Rollup", lambda: rollup.Rollup(data.ledger), lambda: clear_rollups(data_dir)),
+        ("analyze_spending", lambda: FE_FriendlyMain.analyze_spending(data, month_start, month_end),
+         clear_index_caches),
+        ("get_available_weeks", lambda: FE_FriendlyMain.get_available_weeks(data), clear_index_caches),
+        ("potential_savings", lambda: FE_FriendlyMain.potential_savings(data), reset_savings),
+        ("savings_projection",
+         lambda: projection.get_projection(data).grid(PROJECTION_RATES, PROJECTION_HORIZONS), reset_savings),
+    )
+    for case in all_cases:
+        if case[0] in wanted:
+            yield case
+
+
+def cases(data_dir, rows, only=None):
+    """(function name, run, reset) for every benchmarked hot path at one size, or only the named ones."""
+    wanted = [name for name in DATA_CASES + ("predict_on_csv",) if not only or name in only]
+    if not wanted:
+        return
+    expense_path, income_path = ensure_dataset(data_dir, rows)
+    output_path = expense_path.replace("_data.csv", "_predictions.csv")
+
+    if any(name in DATA_CASES for name in wanted):
+        yield from data_cases(data_dir, expense_path, income_path, wanted)
+
+    if "predict_on_csv" in wanted:
+        predictor = predictor_case(expense_path, output_path)
+        if isinstance(predictor, str):
+            yield ("predict_on_csv", predictor, None)
+        else:
+            yield ("predict_on_csv",) + predictor
+
+
+def run_benchmarks(sizes, repeat=DEFAULT_REPEAT, data_dir=DEFAULT_OUT_DIR, only=None):
+    # Error paths report through messagebox; keep them on the console
+    FE_FriendlyMain.messagebox = ConsoleMessages()
+    results = []
+    for rows in sizes:
+        for name, run, reset in cases(data_dir, rows, only):
+            result = {"function": name, "rows": rows}
+            if reset is None:
+                result.update(status="skipped", reason=run)
+            else:
+                try:
+                    result.update(measure(run, reset, repeat), status="ok")
+                except Exception as e:
+                    result.update(status="error", reason=f"{type(e).__name__}: {e}")
+            results.append(result)
+            print(format_result(result))
+        clear_ledgers(data_dir)  # free this size's rows before generating the next
+
+    return {
+        "meta": {
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "sizes": list(sizes),
+            "repeat": repeat,
+            "tk_root_created": getattr(tkinter, "_default_root", None) is not None,
+        },
+        "results": results,
+    }
+
+
+def format_result(result):
+    label = f"{result['function']:<28} {result['rows']:>10,}"
+    if result["status"] != "ok":
+        return f"{label}  {result['status']}: {result['reason']}"
+    warm = result["warm_s"]
+    warm_text = f"{warm * 1000:10.1f} ms" if warm is not None else " " * 13
+    return (f"{label}  cold {result['cold_s'] * 1000:10.1f} ms  warm {warm_text}"
+            f"  peak {result['peak_mib']:8.1f} MiB")
+
+
+def check_regressions(report, baseline, threshold=DEFAULT_THRESHOLD):
+    """Messages for every result slower or bigger than threshold x its baseline value."""
+    previous = {(r["function"], r["rows"]): r for r in baseline.get("results", []) if r.get("status") == "ok"}
+    regressions = []
+    for result in report["results"]:
+        before = previous.get((result["function"], result["rows"]))
+        if before is None or result["status"] != "ok":
+            continue
+        for metric, floor in (("cold_s", MIN_REGRESSION_SECONDS), ("warm_s", MIN_REGRESSION_SECONDS),
+                              ("peak_mib", MIN_REGRESSION_MIB)):
+            now, then = result.get(metric), before.get(metric)
+            if now is None or then is None:
+                continue
+            if now > then * threshold and now - then > floor:
+                regressions.append(f"{result['function']} @ {result['rows']:,} rows: {metric} "
+                                   f"{then:.4g} -> {now:.4g} ({now / then if then else float('inf'):.2f}x)")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Time and memory-profile the data and inference hot paths.")
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES),
+                        help="row counts, e.g. 10000 100000 1000000 10000000")
+    parser.add_argument("--repeat", type=int, default=DEFAULT_REPEAT, help="warm runs per function")
+    parser.add_argument("--data-dir", default=DEFAULT_OUT_DIR, help="where generated CSVs are kept")
+    parser.add_argument("--only", nargs="+", choices=DATA_CASES + ("predict_on_csv",),
+                        help="benchmark only these functions")
+    parser.add_argument("--out", help="results JSON (default: <data-dir>/benchmark_results.json)")
+    parser.add_argument("--baseline", help="results JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="fail when a result is this many times its baseline")
+    parser.add_argument("--update-baseline", action="store_true", help="write these results to --baseline")
+    args = parser.parse_args(argv)
+    found = [name for name in APP_CSV_NAMES if os.path.exists(os.path.join(args.data_dir, name))]
+    if found:
+        parser.error(f"--data-dir {args.data_dir} holds the app's own data ({', '.join(found)}); "
+                     f"benchmarking would wipe its ledger. Use a separate folder.")
+
+    report = run_benchmarks(args.sizes, args.repeat, args.data_dir, args.only)
+    out_path = args.out or os.path.join(args.data_dir, "benchmark_results.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out_path)), exist_ok=True)
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"Results written to {out_path}")
+
+    if not args.baseline:
+        return 0
+    if args.update_baseline or not os.path.exists(args.baseline):
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = check_regressions(report, baseline, args.threshold)
+    for message in regressions:
+        print(f"REGRESSION: {message}")
+    if regressions:
+        return 1
+    print(f"No regressions against {args.baseline} (threshold {args.threshold}x)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,189 @@
+import base64
+import io
+import threading
+import tkinter as tk
+from tkinter import ttk
+
+from background import run_in_background
+from ledger import data_version
+from lru import LRUCache
+from startup_profile import timed_import
+
+
+# How many rendered charts are kept for instant repeat views
+CHART_CACHE_SIZE = 32
+
+CHART_DPI = 100
+PIE_CHART_SIZE = (5, 5)  # inches
+SAVINGS_GRAPH_SIZE = (6, 4.5)
+
+
+def chart_key(data, *parts):
+    # Charts drawn from lists that aren't ledger snapshots are never memoized
+    version = data_version(data)
+    return None if version is None else (version,) + parts
+
+
+# --- Worker side: pooled Agg figures, never touched by Tk ---
+
+_figures = {}  # size -> Figure, reused for every chart of that size
+# matplotlib isn't thread-safe (its font and text caches are shared), so only one
+# worker draws at a time; aggregation still runs in parallel on the pool
+_draw_lock = threading.Lock()
+
+
+def pooled_figure(size):
+    """A cleared Agg figure of the given size; call with _draw_lock held.
+
+    Figures are created with the object API instead of pyplot, so they aren't
+    registered globally, can be drawn off the Tk thread and are never leaked.
+    """
+    fig = _figures.get(size)
+    if fig is None:
+        figure_module = timed_import("matplotlib.figure")
+        backend_agg = timed_import("matplotlib.backends.backend_agg")
+        fig = figure_module.Figure(figsize=size, dpi=CHART_DPI)
+        backend_agg.FigureCanvasAgg(fig)
+        _figures[size] = fig
+    fig.clear()
+    return fig
+
+
+def rasterize(fig):
+    """PNG bytes of a figure, drawn with Agg."""
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png")
+    return buffer.getvalue()
+
+
+def draw_pie_chart(title, spending):
+    with _draw_lock:
+        fig = pooled_figure(PIE_CHART_SIZE)
+        ax = fig.add_subplot()
+        amounts = list(spending.values())
+        total_spent = sum(amounts)
+        ax.pie(amounts, labels=list(spending.keys()),
+               autopct=lambda p: f'{p:.1f}% (${total_spent * p / 100:.2f})', startangle=140)
+        ax.axis('equal')
+        ax.set_title(title)
+        return rasterize(fig)
+
+
+def draw_savings_graph(title, months, savings, savings_with_interest, interest_label):
+    with _draw_lock:
+        fig = pooled_figure(SAVINGS_GRAPH_SIZE)
+        ax = fig.add_subplot()
+        ax.plot(months, savings, marker='o', label="Without Interest")
+        ax.plot(months, savings_with_interest, marker='x', label=f"With {interest_label} Interest")
+        ax.set_xlabel("Month")
+        ax.set_ylabel("Savings ($)")
+        ax.set_title(title)
+        ax.grid(True)
+        ax.legend()
+        fig.tight_layout()
+        return rasterize(fig)
+
+
+# --- Memoized render pipeline ---
+
+_charts = LRUCache(CHART_CACHE_SIZE)
+
+
+def cached_chart(key):
+    return None if key is None else _charts.get(key)
+
+
+def _remember_chart(key, result):
+    if key is not None and result is not None:
+        _charts.put(key, result)
+
+
+def render_chart(widget, key, job, on_done, *args):
+    """Call on_done(job(*args)) on the Tk thread, running job on the worker pool.
+
+    Results are memoized under key (see chart_key), so a repeat view calls on_done
+    straight away. A None key always renders.
+    """
+    result = cached_chart(key)
+    if result is not None:
+        on_done(result)
+        return
+
+    def finish(result):
+        _remember_chart(key, result)
+        on_done(result)
+
+    def failed(error):
+        print(f"Error rendering chart: {error}")
+        on_done(None)
+
+    run_in_background(widget, job, finish, *args, on_error=failed)
+
+
+# --- Tk side: one reusable window per chart kind ---
+
+class ChartWindow:
+    """A chart Toplevel that is hidden on close and reused for the next chart of its kind.
+
+    Only the latest request is shown: request() hands out a token, and show() drops
+    results for older tokens or for a window the user has closed in the meantime.
+    """
+
+    def __init__(self, master, geometry):
+        self.window = tk.Toplevel(master)
+        self.window.geometry(geometry)
+        self.window.protocol("WM_DELETE_WINDOW", self.hide)
+        self.image_label = ttk.Label(self.window, anchor=tk.CENTER)
+        self.image_label.pack(fill=tk.BOTH, expand=True)
+        self.text_label = ttk.Label(self.window, text="")
+        self.text_label.pack(pady=10)
+        close_button = ttk.Button(self.window, text="Close Chart", command=self.hide)
+        close_button.pack(pady=10)
+        self.photo = None
+        self.token = 0
+        self.window.withdraw()
+
+    def request(self, title):
+        self.token += 1
+        self.window.title(title)
+        self.image_label.configure(image="", text="Rendering...")
+        self.text_label.configure(text="")
+        self.window.deiconify()
+        self.window.lift()
+        return self.token
+
+    def show(self, token, png=None, text=""):
+        if token != self.token:
+            return
+        if png is not None:
+            self.photo = tk.PhotoImage(master=self.window, data=base64.b64encode(png).decode("ascii"))
+            self.image_label.configure(image=self.photo, text="")
+        else:
+            self.photo = None
+            self.image_label.configure(image="", text="")
+        self.text_label.configure(text=text)
+
+    def hide(self):
+        self.token += 1  # drop anything still rendering for this window
+        self.window.withdraw()
+
+    def exists(self):
+        try:
+            return bool(self.window.winfo_exists())
+        except tk.TclError:
+            return False
+
+
+_windows = {}
+
+
+def get_chart_window(master, kind, geometry):
+    """The pooled ChartWindow for (master, kind), created on first use."""
+    for dead in [key for key, window in _windows.items() if not window.exists()]:
+        del _windows[dead]
+    key = (str(master), kind)
+    chart_window = _windows.get(key)
+    if chart_window is None or not chart_window.exists():
+        chart_window = ChartWindow(master, geometry)
+        _windows[key] = chart_window
+    return chart_window
@@ -0,0 +1,96 @@
+import json
+import os
+
+from ledger import LEDGER_DIR_NAME, atomic_write_text, get_ledger
+
+
+EXPENSE_FILE = "DBs/expense_data.csv"
+INCOME_FILE = "DBs/income_data.csv"
+PREDICTIONS_FILE = "DBs/expenses_predictions.csv"
+
+
+class DataStore:
+    """Shared, in-process access to the app's CSV-backed data.
+
+    Each getter returns the ledger's current [header] + rows list. The list is reused
+    until the ledger changes, so screens opened one after another share one copy
+    (and the parsed indexes keyed on it) instead of re-reading the CSVs.
+    """
+
+    def __init__(self, expense_file=EXPENSE_FILE, income_file=INCOME_FILE,
+                 predictions_file=PREDICTIONS_FILE):
+        self.expense_file = expense_file
+        self.income_file = income_file
+        self.predictions_file = predictions_file
+        self._cache = {}  # path -> rows list from Ledger.rows()
+
+    def rows(self, path):
+        if not os.path.exists(path):
+            return None
+        ledger = get_ledger(path)
+        ledger.refresh()
+        data = self._cache.get(path)
+        if data is None or data.seq != ledger.seq:
+            data = ledger.rows()
+            self._cache[path] = data
+        return data
+
+    def _summary_path(self):
+        return os.path.join(os.path.dirname(os.path.abspath(self.expense_file)), LEDGER_DIR_NAME,
+                            "summary.json")
+
+    def _source_stamps(self, path):
+        # The CSV plus its ledger files; any write to the rows changes one of these
+        ledger_dir = os.path.join(os.path.dirname(os.path.abspath(path)), LEDGER_DIR_NAME)
+        base = os.path.splitext(os.path.basename(path))[0]
+        stamps = []
+        for file_path in (path, os.path.join(ledger_dir, f"{base}.snapshot.json"),
+                          os.path.join(ledger_dir, f"{base}.journal.jsonl")):
+            try:
+                st = os.stat(file_path)
+                stamps.append([st.st_size, st.st_mtime_ns])
+            except FileNotFoundError:
+                stamps.append(None)
+        return stamps
+
+    def column_total(self, path, column_index=2):
+        """Sum of one column, served from a small summary file while the source is unchanged."""
+        summary_path = self._summary_path()
+        try:
+            with open(summary_path, "r", encoding="utf-8") as f:
+                summary = json.load(f)
+        except (OSError, ValueError):
+            summary = {}
+        key = f"{os.path.abspath(path)}#{column_index}"
+        stamps = self._source_stamps(path)
+        entry = summary.get(key)
+        if entry is not None and entry["stamps"] == stamps:
+            return entry["total"]
+
+        total = 0.0
+        for row in (self.rows(path) or [])[1:]:
+            try:
+                total += float(row[column_index])
+            except (ValueError, IndexError):
+                continue  # skip rows with invalid/missing data
+        # Reading through the ledger may have written its snapshot, so stamp afterwards
+        summary[key] = {"stamps": self._source_stamps(path), "total": total}
+        try:
+            os.makedirs(os.path.dirname(summary_path), exist_ok=True)
+            atomic_write_text(summary_path, json.dumps(summary))
+        except OSError as e:
+            print(f"Warning: Could not write '{summary_path}': {e}")
+        return total
+
+    def balance(self):
+        """Total income minus total expenses."""
+        return self.column_total(self.income_file) - self.column_total(self.expense_file)
+
+    def expenses(self):
+        return self.rows(self.expense_file)
+
+    def income(self):
+        return self.rows(self.income_file)
+
+    def predictions(self):
+        return self.rows(self.predictions_file)
@@ -2,13 +2,11 @@
 # This file was generated by the Tkinter Designer by Parth Jadhav
 # https://github.com/ParthJadhav/Tkinter-Designer
 
-import sys
 import time
 from pathlib import Path
-import subprocess
 # from tkinter import *
 # Explicit imports to satisfy Flake8
-from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
+from tkinter import Canvas, Entry, Text, Button, Frame
 
 
 OUTPUT_PATH = Path(__file__).parent
@@ -19,146 +17,135 @@ def relative_to_assets(path: str) -> Path:
     return ASSETS_PATH / Path(path)
 
 
-def run_script(script_path):
-    """Runs the gui1.py script in a separate process."""
-    try:
-        python_executable = sys.executable
-        subprocess.Popen([python_executable, script_path])
-        print("gui1.py started in a separate process.")
-    except FileNotFoundError:
-        print("Error: gui1.py not found.")
-    except Exception as e:
-        print(f"An error occurred while trying to run gui1.py: {e}")
-
-
-
-
-
-window = Tk()
-
-window.geometry("1920x1080+0+0")
-window.configure(bg = "#FFFFFF")
-
-
-canvas = Canvas(
-    window,
-    bg = "#FFFFFF",
-    height = 1080,
-    width = 1920,
-    bd = 0,
-    highlightthickness = 0,
-    relief = "ridge"
-)
-
-canvas.place(x = 0, y = 0)
-canvas.create_text(
-    798.0,
-    602.0,
-    anchor="nw",
-    text="Password",
-    fill="#000000",
-    font=("Inter", 20 * -1)
-)
-
-image_image_1 = PhotoImage(
-    file=relative_to_assets("image_1.png"))
-image_1 = canvas.create_image(
-    943.0,
-    333.0,
-    image=image_image_1
-)
-
-canvas.create_text(
-    798.0,
-    462.0,
-    anchor="nw",
-    text="Username/ID",
-    fill="#000000",
-    font=("Inter", 20 * -1)
-)
-
-button_image_1 = PhotoImage(
-    file=relative_to_assets("button_1.png"))
-button_1 = Button(
-    image=button_image_1,
-    borderwidth=0,
-    highlightthickness=0,
-    command=lambda: run_script("gui1.py"),
-    relief="flat"
-)
-button_1.place(
-    x=738.0,
-    y=728.0,
-    width=486.0,
-    height=116.0
-)
-
-image_image_2 = PhotoImage(
-    file=relative_to_assets("image_2.png"))
-image_2 = canvas.create_image(
-    959.0,
-    127.0,
-    image=image_image_2
-)
-
-image_image_3 = PhotoImage(
-    file=relative_to_assets("image_3.png"))
-image_3 = canvas.create_image(
-    959.0,
-    540.0,
-    image=image_image_3
-)
-
-entry_image_1 = PhotoImage(
-    file=relative_to_assets("entry_1.png"))
-entry_bg_1 = canvas.create_image(
-    956.5,
-    538.5,
-    image=entry_image_1
-)
-entry_1 = Entry(
-    bd=0,
-    bg="#FFFFFF",
-    fg="#000716",
-    highlightthickness=0,
-    font=("Inter", 20 * -1),
-    show="*"
-)
-entry_1.place(
-    x=808.0,
-    y=516.0,
-    width=297.0,
-    height=43.0
-)
-
-image_image_4 = PhotoImage(
-    file=relative_to_assets("image_4.png"))
-image_4 = canvas.create_image(
-    959.0,
-    675.0,
-    image=image_image_4
-)
-
-entry_image_2 = PhotoImage(
-    file=relative_to_assets("entry_2.png"))
-entry_bg_2 = canvas.create_image(
-    956.5,
-    673.5,
-    image=entry_image_2
-)
-entry_2 = Entry(
-    bd=0,
-    bg="#FFFFFF",
-    fg="#000716",
-    highlightthickness=0,
-    font=("Inter", 20 * -1),
-    show="*"
-)
-entry_2.place(
-    x=808.0,
-    y=651.0,
-    width=297.0,
-    height=43.0
-)
-window.resizable(False, False)
-window.mainloop()
+def build(app):
+    window = Frame(app.root, bg="#FFFFFF")
+
+    canvas = Canvas(
+        window,
+        bg = "#FFFFFF",
+        height = 1080,
+        width = 1920,
+        bd = 0,
+        highlightthickness = 0,
+        relief = "ridge"
+    )
+
+    canvas.place(x = 0, y = 0)
+    canvas.create_text(
+        798.0,
+        602.0,
+        anchor="nw",
+        text="Password",
+        fill="#000000",
+        font=("Inter", 20 * -1)
+    )
+
+    image_image_1 = app.image(
+        relative_to_assets("image_1.png"))
+    image_1 = canvas.create_image(
+        943.0,
+        333.0,
+        image=image_image_1
+    )
+
+    canvas.create_text(
+        798.0,
+        462.0,
+        anchor="nw",
+        text="Username/ID",
+        fill="#000000",
+        font=("Inter", 20 * -1)
+    )
+
+    button_image_1 = app.image(
+        relative_to_assets("button_1.png"))
+    button_1 = Button(
+        window,
+        image=button_image_1,
+        borderwidth=0,
+        highlightthickness=0,
+        command=lambda: app.show('gui1'),
+        relief="flat"
+    )
+    button_1.place(
+        x=738.0,
+        y=728.0,
+        width=486.0,
+        height=116.0
+    )
+
+    image_image_2 = app.image(
+        relative_to_assets("image_2.png"))
+    image_2 = canvas.create_image(
+        959.0,
+        127.0,
+        image=image_image_2
+    )
+
+    image_image_3 = app.image(
+        relative_to_assets("image_3.png"))
+    image_3 = canvas.create_image(
+        959.0,
+        540.0,
+        image=image_image_3
+    )
+
+    entry_image_1 = app.image(
+        relative_to_assets("entry_1.png"))
+    entry_bg_1 = canvas.create_image(
+        956.5,
+        538.5,
+        image=entry_image_1
+    )
+    entry_1 = Entry(
+        window,
+        bd=0,
+        bg="#FFFFFF",
+        fg="#000716",
+        highlightthickness=0,
+        font=("Inter", 20 * -1),
+        show="*"
+    )
+    entry_1.place(
+        x=808.0,
+        y=516.0,
+        width=297.0,
+        height=43.0
+    )
+
+    image_image_4 = app.image(
+        relative_to_assets("image_4.png"))
+    image_4 = canvas.create_image(
+        959.0,
+        675.0,
+        image=image_image_4
+    )
+
+    entry_image_2 = app.image(
+        relative_to_assets("entry_2.png"))
+    entry_bg_2 = canvas.create_image(
+        956.5,
+        673.5,
+        image=entry_image_2
+    )
+    entry_2 = Entry(
+        window,
+        bd=0,
+        bg="#FFFFFF",
+        fg="#000716",
+        highlightthickness=0,
+        font=("Inter", 20 * -1),
+        show="*"
+    )
+    entry_2.place(
+        x=808.0,
+        y=651.0,
+        width=297.0,
+        height=43.0
+    )
+    return window
+
+
+if __name__ == "__main__":
+    from app import main
+    main("gui")
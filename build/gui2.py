@@ -4,11 +4,10 @@
 
 
 from pathlib import Path
-import csv
+from ledger import get_ledger
 # from tkinter import *
 # Explicit imports to satisfy Flake8
-from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import sys
+from tkinter import Canvas, Entry, Text, Button, Frame
 import time
 
 OUTPUT_PATH = Path(__file__).parent
@@ -18,16 +17,14 @@ ASSETS_PATH = OUTPUT_PATH / Path(r"assets/frame2")
 # Define the CSV file path (Change this to your desired path)
 CSV_FILE_PATH = "DBs/income_data.csv"
 
-def save_tocsv():
+def save_tocsv(entry_1, entry_2, entry_3):
     """Saves user inputs from the three textboxes to a CSV file, with a blank line before each new entry."""
     date_input = entry_1.get()
     category_input = entry_2.get()
     amount_input = entry_3.get()
 
-    # Open the CSV file in append mode ("a") to add new rows without overwriting
-    with open(CSV_FILE_PATH, "a", newline="") as file:
-        writer = csv.writer(file, delimiter=",")
-        writer.writerow([date_input, category_input, amount_input])  # Write the actual data
+    # Append through the file's ledger so open screens see the new row without re-reading the CSV
+    get_ledger(CSV_FILE_PATH).add([date_input, category_input, amount_input])
 
     print(f"Saved: {date_input}, {category_input}, {amount_input}")  # Debugging output
 
@@ -39,230 +36,223 @@ def save_inputs(event):
 def relative_to_assets(path: str) -> Path:
     return ASSETS_PATH / Path(path)
 
-import subprocess
-
-def run_script(script_path):
-    """Runs the gui1.py script in a separate process."""
-    try:
-        python_executable = sys.executable
-        subprocess.Popen([python_executable, script_path])
-        print("gui1.py started in a separate process.")
-    except FileNotFoundError:
-        print("Error: gui1.py not found.")
-    except Exception as e:
-        print(f"An error occurred while trying to run gui1.py: {e}")
-
-
-window = Tk()
-
-window.geometry("1920x1080+0+0")
-window.configure(bg = "#FFFFFF")
-
-
-canvas = Canvas(
-    window,
-    bg = "#FFFFFF",
-    height = 1080,
-    width = 1920,
-    bd = 0,
-    highlightthickness = 0,
-    relief = "ridge"
-)
-
-canvas.place(x = 0, y = 0)
-image_image_1 = PhotoImage(
-    file=relative_to_assets("image_1.png"))
-image_1 = canvas.create_image(
-    960.0,
-    320.0,
-    image=image_image_1
-)
-
-button_image_1 = PhotoImage(
-    file=relative_to_assets("button_1.png"))
-button_1 = Button(
-    image=button_image_1,
-    borderwidth=0,
-    highlightthickness=0,
-    command=lambda: run_script('gui1.py'),
-    relief="flat"
-)
-button_1.place(
-    x=0.0,
-    y=958.0,
-    width=297.0,
-    height=108.0
-)
-
-image_image_2 = PhotoImage(
-    file=relative_to_assets("image_2.png"))
-image_2 = canvas.create_image(
-    959.0,
-    127.0,
-    image=image_image_2
-)
-
-button_image_2 = PhotoImage(
-    file=relative_to_assets("button_2.png"))
-button_2 = Button(
-    image=button_image_2,
-    borderwidth=0,
-    highlightthickness=0,
-    command=lambda: save_tocsv(),
-    relief="flat"
-)
-button_2.place(
-    x=733.0,
-    y=671.0,
-    width=492.0,
-    height=190.0
-)
-
-canvas.create_text(
-    601.0,
-    475.0,
-    anchor="nw",
-    text="Date",
-    fill="#000000",
-    font=("Inter", 48 * -1)
-)
-
-canvas.create_text(
-    884.0,
-    470.0,
-    anchor="nw",
-    text="Category",
-    fill="#000000",
-    font=("Inter", 48 * -1)
-)
-
-canvas.create_text(
-    1249.0,
-    477.0,
-    anchor="nw",
-    text="Amount",
-    fill="#000000",
-    font=("Inter", 48 * -1)
-)
-
-image_image_3 = PhotoImage(
-    file=relative_to_assets("image_3.png"))
-image_3 = canvas.create_image(
-    661.0,
-    567.0,
-    image=image_image_3
-)
-
-image_image_4 = PhotoImage(
-    file=relative_to_assets("image_4.png"))
-image_4 = canvas.create_image(
-    1001.0,
-    567.0,
-    image=image_image_4
-)
-
-image_image_5 = PhotoImage(
-    file=relative_to_assets("image_5.png"))
-image_5 = canvas.create_image(
-    1341.0,
-    567.0,
-    image=image_image_5
-)
-
-entry_image_1 = PhotoImage(
-    file=relative_to_assets("entry_1.png"))
-entry_bg_1 = canvas.create_image(
-    658.5,
-    565.5,
-    image=entry_image_1
-)
-entry_1 = Entry(
-    bd=0,
-    bg="#FFFFFF",
-    fg="#000716",
-    highlightthickness=0,
-    font=("Inter",20*-1)
-)
-entry_1.pack()
-
-entry_1.place(
-    x=510.0,
-    y=543.0,
-    width=297.0,
-    height=43.0
-)
-
-entry_image_2 = PhotoImage(
-    file=relative_to_assets("entry_2.png"))
-entry_bg_2 = canvas.create_image(
-    998.5,
-    565.5,
-    image=entry_image_2
-)
-entry_2 = Entry(
-    bd=0,
-    bg="#FFFFFF",
-    fg="#000716",
-    highlightthickness=0,
-    font=("Inter",20*-1)
-)
-entry_2.pack()
-
-entry_2.place(
-    x=850.0,
-    y=543.0,
-    width=297.0,
-    height=43.0
-)
-
-entry_image_3 = PhotoImage(
-    file=relative_to_assets("entry_3.png"))
-entry_bg_3 = canvas.create_image(
-    1338.5,
-    565.5,
-    image=entry_image_3
-)
-entry_3 = Entry(
-    bd=0,
-    bg="#FFFFFF",
-    fg="#000716",
-    highlightthickness=0,
-    font=("Inter",20*-1)
-)
-entry_3.pack()
-
-entry_3.place(
-    x=1190.0,
-    y=543.0,
-    width=297.0,
-    height=43.0
-)
-
-canvas.create_text(
-    606.0,
-    613.0,
-    anchor="nw",
-    text="M/D/YYYY",
-    fill="#000000",
-    font=("Inter", 20 * -1)
-)
-
-canvas.create_text(
-    1241.0,
-    616.0,
-    anchor="nw",
-    text="No Dollar Sign Needed",
-    fill="#000000",
-    font=("Inter", 20 * -1)
-)
-
-canvas.create_text(
-    902.0,
-    613.0,
-    anchor="nw",
-    text="[Work, Misc, Refund]",
-    fill="#000000",
-    font=("Inter", 20 * -1)
-)
-window.resizable(False, False)
-window.mainloop()
+
+def build(app):
+    window = Frame(app.root, bg="#FFFFFF")
+
+    canvas = Canvas(
+        window,
+        bg = "#FFFFFF",
+        height = 1080,
+        width = 1920,
+        bd = 0,
+        highlightthickness = 0,
+        relief = "ridge"
+    )
+
+    canvas.place(x = 0, y = 0)
+    image_image_1 = app.image(
+        relative_to_assets("image_1.png"))
+    image_1 = canvas.create_image(
+        960.0,
+        320.0,
+        image=image_image_1
+    )
+
+    button_image_1 = app.image(
+        relative_to_assets("button_1.png"))
+    button_1 = Button(
+        window,
+        image=button_image_1,
+        borderwidth=0,
+        highlightthickness=0,
+        command=lambda: app.show('gui1'),
+        relief="flat"
+    )
+    button_1.place(
+        x=0.0,
+        y=958.0,
+        width=297.0,
+        height=108.0
+    )
+
+    image_image_2 = app.image(
+        relative_to_assets("image_2.png"))
+    image_2 = canvas.create_image(
+        959.0,
+        127.0,
+        image=image_image_2
+    )
+
+    button_image_2 = app.image(
+        relative_to_assets("button_2.png"))
+    button_2 = Button(
+        window,
+        image=button_image_2,
+        borderwidth=0,
+        highlightthickness=0,
+        command=lambda: save_tocsv(entry_1, entry_2, entry_3),
+        relief="flat"
+    )
+    button_2.place(
+        x=733.0,
+        y=671.0,
+        width=492.0,
+        height=190.0
+    )
+
+    canvas.create_text(
+        601.0,
+        475.0,
+        anchor="nw",
+        text="Date",
+        fill="#000000",
+        font=("Inter", 48 * -1)
+    )
+
+    canvas.create_text(
+        884.0,
+        470.0,
+        anchor="nw",
+        text="Category",
+        fill="#000000",
+        font=("Inter", 48 * -1)
+    )
+
+    canvas.create_text(
+        1249.0,
+        477.0,
+        anchor="nw",
+        text="Amount",
+        fill="#000000",
+        font=("Inter", 48 * -1)
+    )
+
+    image_image_3 = app.image(
+        relative_to_assets("image_3.png"))
+    image_3 = canvas.create_image(
+        661.0,
+        567.0,
+        image=image_image_3
+    )
+
+    image_image_4 = app.image(
+        relative_to_assets("image_4.png"))
+    image_4 = canvas.create_image(
+        1001.0,
+        567.0,
+        image=image_image_4
+    )
+
+    image_image_5 = app.image(
+        relative_to_assets("image_5.png"))
+    image_5 = canvas.create_image(
+        1341.0,
+        567.0,
+        image=image_image_5
+    )
+
+    entry_image_1 = app.image(
+        relative_to_assets("entry_1.png"))
+    entry_bg_1 = canvas.create_image(
+        658.5,
+        565.5,
+        image=entry_image_1
+    )
+    entry_1 = Entry(
+        window,
+        bd=0,
+        bg="#FFFFFF",
+        fg="#000716",
+        highlightthickness=0,
+        font=("Inter",20*-1)
+    )
+    entry_1.pack()
+
+    entry_1.place(
+        x=510.0,
+        y=543.0,
+        width=297.0,
+        height=43.0
+    )
+
+    entry_image_2 = app.image(
+        relative_to_assets("entry_2.png"))
+    entry_bg_2 = canvas.create_image(
+        998.5,
+        565.5,
+        image=entry_image_2
+    )
+    entry_2 = Entry(
+        window,
+        bd=0,
+        bg="#FFFFFF",
+        fg="#000716",
+        highlightthickness=0,
+        font=("Inter",20*-1)
+    )
+    entry_2.pack()
+
+    entry_2.place(
+        x=850.0,
+        y=543.0,
+        width=297.0,
+        height=43.0
+    )
+
+    entry_image_3 = app.image(
+        relative_to_assets("entry_3.png"))
+    entry_bg_3 = canvas.create_image(
+        1338.5,
+        565.5,
+        image=entry_image_3
+    )
+    entry_3 = Entry(
+        window,
+        bd=0,
+        bg="#FFFFFF",
+        fg="#000716",
+        highlightthickness=0,
+        font=("Inter",20*-1)
+    )
+    entry_3.pack()
+
+    entry_3.place(
+        x=1190.0,
+        y=543.0,
+        width=297.0,
+        height=43.0
+    )
+
+    canvas.create_text(
+        606.0,
+        613.0,
+        anchor="nw",
+        text="M/D/YYYY",
+        fill="#000000",
+        font=("Inter", 20 * -1)
+    )
+
+    canvas.create_text(
+        1241.0,
+        616.0,
+        anchor="nw",
+        text="No Dollar Sign Needed",
+        fill="#000000",
+        font=("Inter", 20 * -1)
+    )
+
+    canvas.create_text(
+        902.0,
+        613.0,
+        anchor="nw",
+        text="[Work, Misc, Refund]",
+        fill="#000000",
+        font=("Inter", 20 * -1)
+    )
+    return window
+
+
+if __name__ == "__main__":
+    from app import main
+    main("gui2")
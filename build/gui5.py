@@ -5,118 +5,102 @@
 
 from pathlib import Path
 import FE_FriendlyMain as backend
-import tkinter as tk
 # from tkinter import *
 # Explicit imports to satisfy Flake8
-from tkinter import Tk, Canvas, Entry, Text, Button, PhotoImage
-import sys
+from tkinter import Canvas, Entry, Text, Button, Frame
 import time
 
 
 OUTPUT_PATH = Path(__file__).parent
 ASSETS_PATH = OUTPUT_PATH / Path(r"assets/frame5")
 
-expense_data = backend.read_csv_data_list("DBs/expense_data.csv")
-income_data = backend.read_csv_data_list("DBs/income_data.csv")
-
 def relative_to_assets(path: str) -> Path:
     return ASSETS_PATH / Path(path)
 
-import subprocess
-
-def run_script(script_path):
-    """Runs the gui1.py script in a separate process."""
-    try:
-        python_executable = sys.executable
-        subprocess.Popen([python_executable, script_path])
-        print("gui1.py started in a separate process.")
-    except FileNotFoundError:
-        print("Error: gui1.py not found.")
-    except Exception as e:
-        print(f"An error occurred while trying to run gui1.py: {e}")
-
-
-window = Tk()
-
-window.geometry("1920x1080+0+0")
-window.configure(bg = "#FFFFFF")
-
-
-canvas = Canvas(
-    window,
-    bg = "#FFFFFF",
-    height = 1080,
-    width = 1920,
-    bd = 0,
-    highlightthickness = 0,
-    relief = "ridge"
-)
-
-canvas.place(x = 0, y = 0)
-button_image_1 = PhotoImage(
-    file=relative_to_assets("button_1.png"))
-button_1 = Button(
-    image=button_image_1,
-    borderwidth=0,
-    highlightthickness=0,
-    command=lambda: run_script('gui4.py'),
-    relief="flat"
-)
-button_1.place(
-    x=0.0,
-    y=960.0,
-    width=539.0,
-    height=106.0
-)
-
-image_image_1 = PhotoImage(
-    file=relative_to_assets("image_1.png"))
-image_1 = canvas.create_image(
-    959.0,
-    127.0,
-    image=image_image_1
-)
-
-image_image_2 = PhotoImage(
-    file=relative_to_assets("image_2.png"))
-image_2 = canvas.create_image(
-    959.0,
-    320.0,
-    image=image_image_2
-)
-
-root = tk.Tk()
-
-button_image_2 = PhotoImage(
-    file=relative_to_assets("button_2.png"))
-button_2 = Button(
-    image=button_image_2,
-    borderwidth=0,
-    highlightthickness=0,
-    command=lambda: backend.open_income_chart(root, income_data),
-    relief="flat"
-)
-button_2.place(
-    x=465.0,
-    y=487.0,
-    width=436.0,
-    height=198.0
-)
-
-button_image_3 = PhotoImage(
-    file=relative_to_assets("button_3.png"))
-button_3 = Button(
-    image=button_image_3,
-    borderwidth=0,
-    highlightthickness=0,
-    command=lambda: backend.open_expenses_chart(root, expense_data),
-    relief="flat"
-)
-button_3.place(
-    x=980.0,
-    y=487.0,
-    width=436.0,
-    height=198.0
-)
-window.resizable(False, False)
-window.mainloop()
+
+def build(app):
+    window = Frame(app.root, bg="#FFFFFF")
+
+    canvas = Canvas(
+        window,
+        bg = "#FFFFFF",
+        height = 1080,
+        width = 1920,
+        bd = 0,
+        highlightthickness = 0,
+        relief = "ridge"
+    )
+
+    canvas.place(x = 0, y = 0)
+    button_image_1 = app.image(
+        relative_to_assets("button_1.png"))
+    button_1 = Button(
+        window,
+        image=button_image_1,
+        borderwidth=0,
+        highlightthickness=0,
+        command=lambda: app.show('gui4'),
+        relief="flat"
+    )
+    button_1.place(
+        x=0.0,
+        y=960.0,
+        width=539.0,
+        height=106.0
+    )
+
+    image_image_1 = app.image(
+        relative_to_assets("image_1.png"))
+    image_1 = canvas.create_image(
+        959.0,
+        127.0,
+        image=image_image_1
+    )
+
+    image_image_2 = app.image(
+        relative_to_assets("image_2.png"))
+    image_2 = canvas.create_image(
+        959.0,
+        320.0,
+        image=image_image_2
+    )
+
+    button_image_2 = app.image(
+        relative_to_assets("button_2.png"))
+    button_2 = Button(
+        window,
+        image=button_image_2,
+        borderwidth=0,
+        highlightthickness=0,
+        command=lambda: backend.open_income_chart(app.root, app.data.income()),
+        relief="flat"
+    )
+    button_2.place(
+        x=465.0,
+        y=487.0,
+        width=436.0,
+        height=198.0
+    )
+
+    button_image_3 = app.image(
+        relative_to_assets("button_3.png"))
+    button_3 = Button(
+        window,
+        image=button_image_3,
+        borderwidth=0,
+        highlightthickness=0,
+        command=lambda: backend.open_expenses_chart(app.root, app.data.expenses()),
+        relief="flat"
+    )
+    button_3.place(
+        x=980.0,
+        y=487.0,
+        width=436.0,
+        height=198.0
+    )
+    return window
+
+
+if __name__ == "__main__":
+    from app import main
+    main("gui5")
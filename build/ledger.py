@@ -0,0 +1,417 @@
+import atexit
+import csv
+import io
+import json
+import os
+import shutil
+import threading
+import time
+
+
+# Number of journal records kept before the ledger folds them into a new snapshot
+COMPACT_EVERY = 256
+
+LEDGER_DIR_NAME = ".ledger"
+
+
+class LedgerRow(list):
+    """A CSV row that remembers the stable ledger id it was read from."""
+
+    def __init__(self, values, row_id=None):
+        super().__init__(values)
+        self.row_id = row_id
+
+
+class LedgerData(list):
+    """[header] + rows as returned by Ledger.rows(), tagged with the ledger and its seq."""
+
+    def __init__(self, values, ledger=None, seq=None):
+        super().__init__(values)
+        self.ledger = ledger
+        self.seq = seq
+
+
+def data_version(data):
+    """(csv path, ledger seq) for rows from Ledger.rows(); None for other lists."""
+    ledger = getattr(data, "ledger", None)
+    if ledger is None:
+        return None
+    return os.path.abspath(ledger.csv_path), data.seq
+
+
+def _fsync_dir(dir_path):
+    # Directory fsync makes the rename itself durable; not supported on Windows.
+    if os.name == "nt":
+        return
+    fd = os.open(dir_path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def atomic_write_text(path, text):
+    """Write text to path through a fsync'd temp file and an atomic rename."""
+    dir_path = os.path.dirname(os.path.abspath(path))
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", newline="", encoding="utf-8") as f:
+        f.write(text)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    _fsync_dir(dir_path)
+
+
+def csv_text(rows):
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue()
+
+
+def _file_stamp(path):
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return [st.st_size, st.st_mtime_ns]
+
+
+class Ledger:
+    """Append-only journal with stable row ids in front of one CSV file.
+
+    Every add/edit/delete is one fsync'd line appended to the journal. Every
+    COMPACT_EVERY records the live rows are folded into a snapshot, the CSV is
+    re-exported and the journal is truncated. The CSV stays the exchange format:
+    adds are appended to it directly, edits and deletes are exported on the next
+    compaction or on flush().
+    """
+
+    def __init__(self, csv_path, default_header=None):
+        self.csv_path = csv_path
+        self.default_header = list(default_header) if default_header else None
+        base = os.path.splitext(os.path.basename(csv_path))[0]
+        self.ledger_dir = os.path.join(os.path.dirname(os.path.abspath(csv_path)), LEDGER_DIR_NAME)
+        self.snapshot_path = os.path.join(self.ledger_dir, f"{base}.snapshot.json")
+        self.journal_path = os.path.join(self.ledger_dir, f"{base}.journal.jsonl")
+        self.export_path = os.path.join(self.ledger_dir, f"{base}.export.json")
+
+        self.header = []
+        self._rows = {}  # row id -> list of values, insertion ordered
+        self.next_id = 1
+        self.seq = 0
+        self._snapshot_seq = 0
+        self._export = {"seq": 0, "stamp": None}
+        self._lock = threading.RLock()
+        self._listeners = []
+        self._load()
+
+    # --- Loading ---
+
+    def _load(self):
+        os.makedirs(self.ledger_dir, exist_ok=True)
+        if not os.path.exists(self.snapshot_path):
+            self._import_csv()
+            return
+
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        self.header = snapshot["header"]
+        self._rows = {row_id: row for row_id, row in snapshot["rows"]}
+        self.next_id = snapshot["next_id"]
+        self.seq = self._snapshot_seq = snapshot["seq"]
+        self._replay_journal()
+
+        if os.path.exists(self.export_path):
+            with open(self.export_path, "r", encoding="utf-8") as f:
+                self._export = json.load(f)
+        self._check_external_edit()
+
+    def _replay_journal(self):
+        if not os.path.exists(self.journal_path):
+            return
+        good_end = 0  # byte offset just past the last complete record
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("no newline")
+                    record = json.loads(line)
+                except ValueError:
+                    # A torn final line from a crash mid-append; everything before it is intact.
+                    print(f"Warning: Ignoring incomplete journal record in '{self.journal_path}'")
+                    break
+                good_end += len(line)
+                if record["seq"] <= self.seq:
+                    continue  # Already folded into the snapshot
+                self._apply(record)
+        if good_end != os.path.getsize(self.journal_path):
+            # Cut the fragment off so the next append starts on a fresh line
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_end)
+                f.flush()
+                os.fsync(f.fileno())
+
+    def _import_csv(self):
+        rows = []
+        header = self.default_header or []
+        if os.path.exists(self.csv_path):
+            with open(self.csv_path, "r", newline="", encoding="utf-8") as csvfile:
+                reader = csv.reader(csvfile)
+                header = next(reader, header)
+                rows = [row for row in reader if row]
+        # Rows that are still in the file keep their ids; new rows get fresh ones, so an
+        # id held by an open screen never ends up pointing at a different row
+        old_ids = {}
+        for row_id, row in self._rows.items():
+            old_ids.setdefault(tuple(row), []).append(row_id)
+        self.header = list(header)
+        self._rows = {}
+        for row in rows:
+            ids = old_ids.get(tuple(row))
+            if ids:
+                self._rows[ids.pop(0)] = row
+            else:
+                self._rows[self.next_id] = row
+                self.next_id += 1
+        self.seq += 1
+        self._write_snapshot()
+        self._export = {"seq": self.seq, "stamp": _file_stamp(self.csv_path)}
+        atomic_write_text(self.export_path, json.dumps(self._export))
+        atomic_write_text(self.journal_path, "")
+
+    def _check_external_edit(self):
+        # The CSV stays hand-editable. When the file no longer matches what the ledger
+        # last exported, pick up the external version.
+        stamp = _file_stamp(self.csv_path)
+        if stamp == self._export.get("stamp"):
+            return False
+        if stamp is None:
+            # A missing CSV isn't an edit: the snapshot and journal still hold every row
+            if self.header or self._rows:
+                print(f"Info: '{self.csv_path}' is missing, re-exporting it from the ledger.")
+                self.export_csv()
+            return False
+        if self._export.get("seq") == self.seq:
+            print(f"Info: '{self.csv_path}' changed outside the ledger, re-importing.")
+            self._import_csv()
+        else:
+            # Edits and deletes are only exported on compaction or at exit, so keep the
+            # outside version next to the CSV instead of overwriting it
+            external_path = self._external_copy_path(stamp)
+            shutil.copy2(self.csv_path, external_path)
+            print(f"Warning: '{self.csv_path}' changed outside the ledger while it had "
+                  f"unexported edits; keeping the ledger version. The outside version "
+                  f"was saved as '{external_path}'.")
+            self.export_csv()
+        self._notify()
+        return True
+
+    def _external_copy_path(self, stamp):
+        root = os.path.splitext(self.csv_path)[0]
+        mtime = time.strftime("%Y%m%d-%H%M%S", time.localtime(stamp[1] / 1e9))
+        path = f"{root}.external-{mtime}.csv"
+        n = 1
+        while os.path.exists(path):
+            n += 1
+            path = f"{root}.external-{mtime}-{n}.csv"
+        return path
+
+    # --- Journal ---
+
+    def _apply(self, record):
+        op = record["op"]
+        row_id = record.get("id")
+        if op == "add":
+            self._rows[row_id] = record["row"]
+            self.next_id = max(self.next_id, row_id + 1)
+        elif op == "edit":
+            if row_id in self._rows:
+                self._rows[row_id] = record["row"]
+        elif op == "delete":
+            self._rows.pop(row_id, None)
+        self.seq = record["seq"]
+
+    def _append(self, *records):
+        # One write and one fsync for the whole batch
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(record) + "\n" for record in records))
+            f.flush()
+            os.fsync(f.fileno())
+        for record in records:
+            self._apply(record)
+
+    def _write_snapshot(self):
+        snapshot = {
+            "header": self.header,
+            "next_id": self.next_id,
+            "seq": self.seq,
+            "rows": [[row_id, row] for row_id, row in self._rows.items()],
+        }
+        atomic_write_text(self.snapshot_path, json.dumps(snapshot))
+        self._snapshot_seq = self.seq
+
+    def _maybe_compact(self):
+        if self.seq - self._snapshot_seq >= COMPACT_EVERY:
+            self.compact()
+
+    # --- Public API ---
+
+    def add_listener(self, callback):
+        """Call callback(ledger, op, row_id, row, old_row) after each committed change.
+
+        op is "add", "edit", "delete" or "reload" (the rows were re-imported from the CSV).
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, op="reload", row_id=None, row=None, old_row=None):
+        for callback in self._listeners:
+            try:
+                callback(self, op, row_id, row, old_row)
+            except Exception as e:
+                print(f"Warning: ledger listener failed: {e}")
+
+    def refresh(self):
+        """Pick up outside edits to the CSV; returns True if the rows were reloaded."""
+        with self._lock:
+            return self._check_external_edit()
+
+    def rows(self):
+        """Return [header] + rows, each row a LedgerRow carrying its id."""
+        with self._lock:
+            self._check_external_edit()
+            rows = [list(self.header)] + [LedgerRow(row, row_id) for row_id, row in self._rows.items()]
+            return LedgerData(rows, self, self.seq)
+
+    def items(self):
+        """(row_id, row) pairs of the live rows, without checking the CSV for outside edits."""
+        with self._lock:
+            return list(self._rows.items())
+
+    def get(self, row_id):
+        with self._lock:
+            row = self._rows.get(row_id)
+            return None if row is None else LedgerRow(row, row_id)
+
+    def add(self, row):
+        return self.add_many([row])[0]
+
+    def add_many(self, rows):
+        """Append rows in one journal write; returns their new ids."""
+        with self._lock:
+            self._check_external_edit()
+            rows = [[str(value) for value in row] for row in rows]
+            if not rows:
+                return []
+            row_ids = list(range(self.next_id, self.next_id + len(rows)))
+            in_sync = self._export.get("seq") == self.seq
+            self._append(*[{"seq": self.seq + i, "op": "add", "id": row_id, "row": row}
+                           for i, (row_id, row) in enumerate(zip(row_ids, rows), start=1)])
+            if in_sync:
+                # Adds keep the CSV current by appending lines.
+                self._append_csv_rows(rows)
+            for row_id, row in zip(row_ids, rows):
+                self._notify("add", row_id, row)
+            self._maybe_compact()
+            return row_ids
+
+    def edit(self, row_id, row):
+        with self._lock:
+            if row_id not in self._rows:
+                return False
+            row = [str(value) for value in row]
+            old_row = self._rows[row_id]
+            self._append({"seq": self.seq + 1, "op": "edit", "id": row_id, "row": row})
+            self._notify("edit", row_id, row, old_row)
+            self._maybe_compact()
+            return True
+
+    def delete(self, row_id):
+        return self.delete_many([row_id]) == 1
+
+    def delete_many(self, row_ids):
+        """Delete rows in one journal write; returns how many existed."""
+        with self._lock:
+            row_ids = [row_id for row_id in dict.fromkeys(row_ids) if row_id in self._rows]
+            if not row_ids:
+                return 0
+            old_rows = [self._rows[row_id] for row_id in row_ids]
+            self._append(*[{"seq": self.seq + i, "op": "delete", "id": row_id}
+                           for i, row_id in enumerate(row_ids, start=1)])
+            for row_id, old_row in zip(row_ids, old_rows):
+                self._notify("delete", row_id, None, old_row)
+            self._maybe_compact()
+            return len(row_ids)
+
+    def replace_all(self, header, rows):
+        """Swap in a new header and row set (new ids) as a fresh snapshot and CSV export."""
+        with self._lock:
+            self.header = list(header)
+            self._rows = {}
+            for row in rows:
+                self._rows[self.next_id] = [str(value) for value in row]
+                self.next_id += 1
+            self.seq += 1
+            self.compact()
+            self._notify()
+
+    def _append_csv_rows(self, rows):
+        new_file = not os.path.exists(self.csv_path) or os.path.getsize(self.csv_path) == 0
+        with open(self.csv_path, "a", newline="", encoding="utf-8") as csvfile:
+            writer = csv.writer(csvfile)
+            if new_file:
+                writer.writerow(self.header)
+            writer.writerows(rows)
+            csvfile.flush()
+            os.fsync(csvfile.fileno())
+        self._record_export()
+
+    def _record_export(self):
+        self._export = {"seq": self.seq, "stamp": _file_stamp(self.csv_path)}
+        atomic_write_text(self.export_path, json.dumps(self._export))
+
+    def export_csv(self, path=None):
+        """Atomically write the live rows to path (the source CSV by default)."""
+        with self._lock:
+            data = [self.header] + list(self._rows.values())
+            atomic_write_text(path or self.csv_path, csv_text(data))
+            if path is None or os.path.abspath(path) == os.path.abspath(self.csv_path):
+                self._record_export()
+
+    def flush(self):
+        """Export pending edits/deletes to the CSV if it is behind the journal."""
+        with self._lock:
+            if self._export.get("seq") != self.seq:
+                self.export_csv()
+
+    def compact(self):
+        """Fold the journal into a new snapshot, export the CSV and truncate the journal."""
+        with self._lock:
+            self._write_snapshot()
+            self.flush()
+            atomic_write_text(self.journal_path, "")
+
+
+_ledgers = {}
+_ledgers_lock = threading.Lock()
+
+
+def get_ledger(csv_path, default_header=None):
+    """Return the shared Ledger for csv_path, creating it on first use."""
+    key = os.path.abspath(csv_path)
+    with _ledgers_lock:
+        ledger = _ledgers.get(key)
+        if ledger is None:
+            ledger = Ledger(csv_path, default_header)
+            _ledgers[key] = ledger
+        return ledger
+
+
+def flush_all():
+    for ledger in list(_ledgers.values()):
+        try:
+            ledger.flush()
+        except Exception as e:
+            print(f"Error flushing ledger for '{ledger.csv_path}': {e}")
+
+
+atexit.register(flush_all)
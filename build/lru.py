@@ -0,0 +1,37 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe map that keeps only the size most recently used entries.
+
+    Shared by the store, sort index, projection and chart caches, which are filled
+    from the worker pool and read from the Tk thread.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            value = self._items.get(key, default)
+            if key in self._items:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.size:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
@@ -0,0 +1,132 @@
+import csv
+import sys
+import threading
+from datetime import date
+
+import numpy as np
+
+from ledger import data_version, get_ledger
+from lru import LRUCache
+from rollup import rollup_for
+from tx_store import find_column, get_store
+
+
+DEFAULT_HORIZON = 12  # months
+
+# Monthly rates used by the batch report when none are given
+DEFAULT_RATES = (0.0, 0.0001, 0.0041, 0.04)
+
+# How many data lists get_projection keeps projections for
+PROJECTION_CACHE_SIZE = 8
+
+
+def future_value_grid(contributions, rates, horizons):
+    """Savings after saving each contribution monthly for each horizon at each rate.
+
+    Returns an array of shape (len(rates), len(horizons), len(contributions)). A
+    non-zero rate r gives c * ((1 + r)**h - 1) / r; a zero rate gives c * h.
+    """
+    c = np.asarray(contributions, dtype=float).reshape(1, 1, -1)
+    r = np.asarray(rates, dtype=float).reshape(-1, 1, 1)
+    h = np.asarray(horizons, dtype=float).reshape(1, -1, 1)
+    growth = np.expm1(h * np.log1p(r))  # (1 + r)**h - 1, accurate for tiny rates
+    factor = np.divide(growth, r, out=np.broadcast_to(h, growth.shape).copy(), where=r != 0)
+    return factor * c
+
+
+def _month_bounds(month):
+    year, month_number = map(int, month.split('-'))
+    end = date(year + 1, 1, 1) if month_number == 12 else date(year, month_number + 1, 1)
+    return date(year, month_number, 1), end
+
+
+def monthly_non_necessity(data):
+    """(months, totals): non-necessity spending per 'YYYY-MM' month, months ascending."""
+    if not data or len(data) < 2:
+        return [], np.zeros(0)
+    header = data[0]
+    if any(find_column(header, col) == -1 for col in ("Date", "Cost", "Necessity")):
+        print("Warning: 'Date', 'Cost' or 'Necessity' column not found. No savings to project.")
+        return [], np.zeros(0)
+
+    rollup = rollup_for(data)
+    if rollup is not None:
+        totals = rollup.period_totals("month", necessity="No")
+    else:
+        store = get_store(data)
+        totals = {month: store.total(*_month_bounds(month), non_necessity_only=True)
+                  for month in sorted(store.months())}
+    months = list(totals)
+    return months, np.fromiter(totals.values(), dtype=float, count=len(months))
+
+
+class SavingsProjection:
+    """Projections of saving each month's non-necessity spending, for one data list.
+
+    Plain NumPy and the ledger, no Tk, so it also runs headless:
+    python projection.py DBs/expense_data.csv [rate ...] prints a CSV report.
+    """
+
+    def __init__(self, data):
+        self.months, self.contributions = monthly_non_necessity(data)
+        self._month_index = {month: i for i, month in enumerate(self.months)}
+        self._grids = {}
+        self._lock = threading.Lock()
+
+    def contribution(self, month):
+        i = self._month_index.get(month)
+        return 0.0 if i is None else float(self.contributions[i])
+
+    def grid(self, rates, horizons=range(1, DEFAULT_HORIZON + 1)):
+        """future_value_grid over every month's contribution; cached per (rates, horizons)."""
+        key = (tuple(rates), tuple(horizons))
+        with self._lock:
+            grid = self._grids.get(key)
+        if grid is None:
+            grid = future_value_grid(self.contributions, key[0], key[1])
+            grid.setflags(write=False)  # shared between callers
+            with self._lock:
+                self._grids[key] = grid
+        return grid
+
+    def paths(self, month, rates, horizon=DEFAULT_HORIZON):
+        """Cumulative savings after 1..horizon months of saving month's total, one row per rate."""
+        i = self._month_index.get(month)
+        if i is None:
+            return np.zeros((len(rates), horizon))
+        return self.grid(rates, range(1, horizon + 1))[:, :, i]
+
+    def rows(self, rates=DEFAULT_RATES, horizons=(DEFAULT_HORIZON,)):
+        """[header] + one row per month, rate and horizon, for batch reports."""
+        grid = self.grid(rates, horizons)
+        rows = [["Month", "Contribution", "Rate", "Horizon", "Savings"]]
+        for k, month in enumerate(self.months):
+            for i, rate in enumerate(rates):
+                for j, horizon in enumerate(horizons):
+                    rows.append([month, f"{self.contributions[k]:.2f}", rate, horizon, f"{grid[i, j, k]:.2f}"])
+        return rows
+
+
+_projections = LRUCache(PROJECTION_CACHE_SIZE)
+
+
+def get_projection(data):
+    """Return the SavingsProjection for a data list, built once per dataset version."""
+    version = data_version(data)
+    key = version if version is not None else (id(data), len(data) if data else 0)
+    cached = _projections.get(key)
+    # Lists without a version are matched by identity, so keep them alongside
+    if cached is not None and (version is not None or cached[0] is data):
+        return cached[1]
+    projection = SavingsProjection(data)
+    _projections.put(key, (data, projection))
+    return projection
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("Usage: python projection.py <expense csv> [monthly rate ...]")
+        sys.exit(1)
+    report_rates = tuple(float(rate) for rate in sys.argv[2:]) or DEFAULT_RATES
+    projection = get_projection(get_ledger(sys.argv[1]).rows())
+    csv.writer(sys.stdout, lineterminator="\n").writerows(projection.rows(report_rates))
@@ -0,0 +1,260 @@
+import atexit
+import json
+import os
+import threading
+from datetime import datetime
+
+from ledger import atomic_write_text
+from tx_store import DATE_FORMAT, find_column, parse_amount
+
+
+GRANULARITIES = ("day", "week", "month", "year")
+
+
+def period_keys(row_date):
+    """Period key per granularity, matching the strings shown in the chart dropdowns."""
+    year, week, _ = row_date.isocalendar()
+    return {
+        "day": row_date.strftime('%Y-%m-%d'),
+        "week": f'{year}-W{week:02d}',
+        "month": row_date.strftime('%Y-%m'),
+        "year": str(row_date.year),
+    }
+
+
+class Rollup:
+    """Per-(period, category, necessity) sums and counts for one ledger.
+
+    cube[granularity][period][(category, necessity)] = [sum, count], kept for day,
+    ISO week, month and year. The ledger notifies the rollup of every add/edit/delete,
+    so totals are adjusted in place instead of re-reading rows. The cube is saved to
+    <csv name>.<amount col>.rollup.json with the ledger's own files, so it goes
+    away with them, and is rebuilt from the ledger when its seq no longer matches.
+
+    A rebuild counts a copy of the rows without holding the ledger's lock, so edits
+    on the Tk thread don't wait for it; while one is due the rollup is stale, ignores
+    edits and reports itself out of sync.
+    """
+
+    def __init__(self, ledger, amount_col="Cost", category_col="Category", date_col="Date",
+                 necessity_col="Necessity"):
+        self.ledger = ledger
+        self.amount_col = amount_col
+        self.category_col = category_col
+        self.date_col = date_col
+        self.necessity_col = necessity_col
+        base = os.path.splitext(os.path.basename(ledger.csv_path))[0]
+        self.path = os.path.join(ledger.ledger_dir, f"{base}.{amount_col}.rollup.json")
+        self.seq = None
+        self.cube = {}
+        self._dirty = False
+        self._stale = True
+        self._lock = threading.RLock()
+        self._indexes = None
+
+        # Holding the ledger's lock means no edit can land between loading the cube
+        # and subscribing to changes
+        with ledger._lock:
+            if self._load():
+                self._stale = False
+            ledger.add_listener(self._on_change)
+        if self._stale:
+            self.rebuild()
+
+    # --- Row handling ---
+
+    def _column_indexes(self):
+        header = self.ledger.header
+        return (find_column(header, self.date_col), find_column(header, self.category_col),
+                find_column(header, self.amount_col), find_column(header, self.necessity_col))
+
+    def _row_entry(self, row, indexes, parsed_dates=None):
+        # (period keys, category, necessity, amount) for a row, or None when it can't be counted
+        date_index, category_index, amount_index, necessity_index = indexes
+        if -1 in (date_index, category_index, amount_index):
+            return None
+        try:
+            date_str = row[date_index]
+            keys = parsed_dates.get(date_str) if parsed_dates is not None else None
+            if keys is None:
+                keys = period_keys(datetime.strptime(date_str, DATE_FORMAT))
+                if parsed_dates is not None:
+                    parsed_dates[date_str] = keys
+            amount = parse_amount(row[amount_index])
+            category = row[category_index].strip()
+        except (ValueError, IndexError):
+            return None
+        necessity = ""
+        if necessity_index != -1 and necessity_index < len(row):
+            necessity = row[necessity_index].strip().lower()
+        return keys, category, necessity, amount
+
+    def _apply_row(self, row, sign):
+        self._count_row(self.cube, row, sign, self._indexes)
+
+    def _count_row(self, cube, row, sign, indexes, parsed_dates=None):
+        entry = self._row_entry(row, indexes, parsed_dates)
+        if entry is None:
+            return
+        keys, category, necessity, amount = entry
+        cell_key = (category, necessity)
+        for granularity in GRANULARITIES:
+            periods = cube.setdefault(granularity, {})
+            cells = periods.setdefault(keys[granularity], {})
+            cell = cells.setdefault(cell_key, [0.0, 0])
+            cell[0] += sign * amount
+            cell[1] += sign
+            if cell[1] <= 0:
+                del cells[cell_key]
+                if not cells:
+                    del periods[keys[granularity]]
+
+    def _on_change(self, ledger, op, row_id, row, old_row):
+        with self._lock:
+            if op == "reload":
+                # Recounted by the next rollup_for, on the thread asking for totals
+                self._stale = True
+                return
+            if self._stale:
+                return  # The pending rebuild counts this edit
+            if old_row is not None:
+                self._apply_row(old_row, -1)
+            if row is not None:
+                self._apply_row(row, 1)
+            self.seq = ledger.seq
+            self._dirty = True
+
+    # --- Persistence ---
+
+    def rebuild(self):
+        """Recount the cube from the ledger's rows, retrying if they change meanwhile."""
+        while True:
+            with self.ledger._lock:
+                seq = self.ledger.seq
+                items = self.ledger.items()
+                indexes = self._column_indexes()
+            cube = {}
+            parsed_dates = {}  # each distinct date string is parsed once
+            for _, row in items:
+                self._count_row(cube, row, 1, indexes, parsed_dates)
+            with self.ledger._lock, self._lock:  # ledger first, the order edits notify in
+                if self.ledger.seq != seq:
+                    continue
+                self._indexes = indexes
+                self.cube = cube
+                self.seq = seq
+                self._stale = False
+                self._dirty = True
+            self.save()
+            return
+
+    def _load(self):
+        self._indexes = self._column_indexes()
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"Warning: Could not read rollup '{self.path}': {e}")
+            return False
+        if saved.get("seq") != self.ledger.seq or saved.get("columns") != self._saved_columns():
+            return False  # Out of sync with the source rows
+        self.cube = {
+            granularity: {
+                period: {(category, necessity): [total, count] for category, necessity, total, count in cells}
+                for period, cells in periods.items()
+            }
+            for granularity, periods in saved["cube"].items()
+        }
+        self.seq = saved["seq"]
+        return True
+
+    def _saved_columns(self):
+        return [self.date_col, self.category_col, self.amount_col, self.necessity_col]
+
+    def save(self):
+        with self._lock:
+            if not self._dirty:
+                return
+            saved = {
+                "seq": self.seq,
+                "columns": self._saved_columns(),
+                "cube": {
+                    granularity: {
+                        period: [[category, necessity, total, count]
+                                 for (category, necessity), (total, count) in cells.items()]
+                        for period, cells in periods.items()
+                    }
+                    for granularity, periods in self.cube.items()
+                },
+            }
+            atomic_write_text(self.path, json.dumps(saved))
+            self._dirty = False
+
+    # --- Queries ---
+
+    def in_sync_with(self, data):
+        """True when data (from Ledger.rows()) reflects the same rows as this rollup."""
+        return (not self._stale and getattr(data, "ledger", None) is self.ledger
+                and getattr(data, "seq", None) == self.seq)
+
+    def category_totals(self, granularity, period, necessity=None):
+        """{category: total} for one period, optionally only rows with the given necessity."""
+        totals = {}
+        with self._lock:  # charts query from worker threads while the Tk thread applies edits
+            cells = list(self.cube.get(granularity, {}).get(period, {}).items())
+        for (category, row_necessity), (total, _) in cells:
+            if necessity is None or row_necessity == necessity.lower():
+                totals[category] = totals.get(category, 0) + total
+        return totals
+
+    def total(self, granularity, period, necessity=None):
+        return sum(self.category_totals(granularity, period, necessity).values())
+
+    def period_totals(self, granularity, necessity=None):
+        """{period: total} for every period of a granularity, in ascending order."""
+        with self._lock:
+            return {period: self.total(granularity, period, necessity)
+                    for period in sorted(self.cube.get(granularity, {}))}
+
+    def periods(self, granularity):
+        with self._lock:
+            return sorted(self.cube.get(granularity, {}), reverse=True)
+
+
+_rollups = {}
+_rollups_lock = threading.Lock()
+
+
+def get_rollup(ledger, amount_col="Cost"):
+    """Return the shared Rollup for a ledger, loading or rebuilding it on first use."""
+    key = (os.path.abspath(ledger.csv_path), amount_col)
+    with _rollups_lock:
+        rollup = _rollups.get(key)
+        if rollup is None or rollup.ledger is not ledger:
+            rollup = Rollup(ledger, amount_col=amount_col)
+            _rollups[key] = rollup
+        return rollup
+
+
+def rollup_for(data, amount_col="Cost"):
+    """Rollup matching a data list read from a ledger, or None if there is none in sync."""
+    ledger = getattr(data, "ledger", None)
+    if ledger is None:
+        return None
+    rollup = get_rollup(ledger, amount_col)
+    if rollup._stale:
+        rollup.rebuild()  # The ledger was reloaded from an outside CSV edit
+    return rollup if rollup.in_sync_with(data) else None
+
+
+def save_all():
+    for rollup in list(_rollups.values()):
+        try:
+            rollup.save()
+        except Exception as e:
+            print(f"Error saving rollup '{rollup.path}': {e}")
+
+
+atexit.register(save_all)
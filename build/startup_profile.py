@@ -0,0 +1,76 @@
+import importlib
+import json
+import os
+import sys
+import threading
+import time
+
+
+# Reference point for every timing; app.py imports this module first
+_T0 = time.perf_counter()
+
+_events = []  # (label, seconds since start, duration or None)
+_lock = threading.Lock()
+
+
+def enabled():
+    """Profiling output is on with SMARTSAVER_PROFILE=1 or a --profile argument."""
+    return os.environ.get("SMARTSAVER_PROFILE", "") not in ("", "0") or "--profile" in sys.argv
+
+
+def elapsed():
+    return time.perf_counter() - _T0
+
+
+def mark(label, duration=None):
+    with _lock:
+        _events.append((label, elapsed(), duration))
+
+
+def timed_import(name):
+    """Import a module on first use, recording how long the import took.
+
+    Always goes through importlib, which waits on the module's import lock: a module
+    is in sys.modules before its body has run, so another thread's half-done import
+    must not be handed back as is.
+    """
+    loaded = _is_loaded(name)
+    start = time.perf_counter()
+    module = importlib.import_module(name)
+    if not loaded:
+        mark(f"import {name} ({threading.current_thread().name})", time.perf_counter() - start)
+    return module
+
+
+def _is_loaded(name):
+    # The import system flags a module whose body is still running with
+    # __spec__._initializing, the same check it uses before taking the module lock
+    module = sys.modules.get(name)
+    if module is None:
+        return False
+    spec = getattr(module, "__spec__", None)
+    return not getattr(spec, "_initializing", False)
+
+
+def report():
+    with _lock:
+        events = list(_events)
+    lines = ["Startup timing (seconds since start):"]
+    for label, at, duration in events:
+        if duration is None:
+            lines.append(f"  {at:8.3f}  {label}")
+        else:
+            lines.append(f"  {at:8.3f}  {label}: {duration * 1000:.1f} ms")
+    return "\n".join(lines)
+
+
+def print_report():
+    if enabled():
+        print(report())
+
+
+def write_report(path):
+    with _lock:
+        events = [{"label": label, "at": at, "duration": duration} for label, at, duration in _events]
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(events, f, indent=2)
@@ -0,0 +1,133 @@
+import argparse
+import csv
+import os
+import random
+from datetime import date, timedelta
+
+
+DEFAULT_OUT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "DBs", "synthetic")
+
+DEFAULT_START = date(2020, 1, 1)
+DEFAULT_DAYS = 5 * 365
+
+# Rows written per csv.writer call
+CHUNK_ROWS = 100_000
+
+# category -> (share of rows, lowest cost, highest cost, chance the expense is not a necessity),
+# roughly the mix in DBs/expenses_predictions.csv
+EXPENSE_PROFILE = {
+    "Groceries": (0.20, 20.0, 150.0, 0.0),
+    "Transportation": (0.20, 10.0, 120.0, 0.0),
+    "Bills": (0.15, 60.0, 250.0, 0.27),
+    "Food": (0.20, 8.0, 80.0, 0.38),
+    "Entertainment": (0.25, 5.0, 150.0, 0.53),
+}
+
+# category -> (share of rows, lowest amount, highest amount), as in DBs/income_data.csv
+INCOME_PROFILE = {
+    "Work": (0.70, 1200.0, 2500.0),
+    "Misc": (0.20, 10.0, 100.0),
+    "Refund": (0.10, 5.0, 80.0),
+}
+
+
+def dataset_paths(out_dir, rows):
+    """(expense csv, income csv) paths for one generated size."""
+    return (os.path.join(out_dir, f"expense_{rows}_data.csv"),
+            os.path.join(out_dir, f"income_{rows}_data.csv"))
+
+
+def _dates(rows, start, days):
+    # Rows are spread evenly over the range in date order, like an exported ledger
+    date_strs = [(start + timedelta(days=day)).strftime('%m/%d/%Y') for day in range(days)]
+    for i in range(rows):
+        yield date_strs[i * days // rows]
+
+
+def _categories(rng, categories, weights, rows):
+    # Drawn a chunk at a time so 10M-row files don't hold every choice in memory
+    for done in range(0, rows, CHUNK_ROWS):
+        yield from rng.choices(categories, weights, k=min(CHUNK_ROWS, rows - done))
+
+
+def _write_rows(path, header, rows):
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        chunk = []
+        for row in rows:
+            chunk.append(row)
+            if len(chunk) >= CHUNK_ROWS:
+                writer.writerows(chunk)
+                chunk = []
+        writer.writerows(chunk)
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_expenses(path, rows, seed=0, necessity=True, start=DEFAULT_START, days=DEFAULT_DAYS):
+    """Write rows expenses as Date,Category,Cost[,Necessity]."""
+    rng = random.Random(seed)
+    categories = list(EXPENSE_PROFILE)
+    weights = [EXPENSE_PROFILE[c][0] for c in categories]
+    header = ["Date", "Category", "Cost", "Necessity"] if necessity else ["Date", "Category", "Cost"]
+
+    def generate():
+        for date_str, category in zip(_dates(rows, start, days), _categories(rng, categories, weights, rows)):
+            _, low, high, not_needed = EXPENSE_PROFILE[category]
+            cost = f"{rng.uniform(low, high):.2f}"
+            if necessity:
+                yield [date_str, category, cost, "No" if rng.random() < not_needed else "Yes"]
+            else:
+                yield [date_str, category, cost]
+
+    return _write_rows(path, header, generate())
+
+
+def write_income(path, rows, seed=0, start=DEFAULT_START, days=DEFAULT_DAYS):
+    """Write rows income entries as Date,Category,Amount."""
+    rng = random.Random(seed + 1)
+    categories = list(INCOME_PROFILE)
+    weights = [INCOME_PROFILE[c][0] for c in categories]
+
+    def generate():
+        for date_str, category in zip(_dates(rows, start, days), _categories(rng, categories, weights, rows)):
+            _, low, high = INCOME_PROFILE[category]
+            yield [date_str, category, f"{rng.uniform(low, high):.2f}"]
+
+    return _write_rows(path, ["Date", "Category", "Amount"], generate())
+
+
+def ensure_dataset(out_dir, rows, seed=0, necessity=True):
+    """Generate the expense and income CSVs for a size unless they already exist."""
+    expense_path, income_path = dataset_paths(out_dir, rows)
+    if not os.path.exists(expense_path):
+        print(f"Generating {rows} expenses -> {expense_path}")
+        write_expenses(expense_path, rows, seed, necessity)
+    if not os.path.exists(income_path):
+        print(f"Generating {rows} income entries -> {income_path}")
+        write_income(income_path, rows, seed)
+    return expense_path, income_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic expense and income CSVs.")
+    parser.add_argument("rows", nargs="+", type=int, help="row counts to generate, e.g. 10000 1000000")
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="output directory")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-necessity", action="store_true", help="leave out the Necessity column")
+    parser.add_argument("--force", action="store_true", help="regenerate files that already exist")
+    args = parser.parse_args(argv)
+
+    for rows in args.rows:
+        if args.force:
+            for path in dataset_paths(args.out, rows):
+                if os.path.exists(path):
+                    os.remove(path)
+        ensure_dataset(args.out, rows, args.seed, not args.no_necessity)
+
+
+if __name__ == "__main__":
+    main()
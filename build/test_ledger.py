@@ -0,0 +1,102 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+
+from ledger import Ledger
+
+
+HEADER = ["Date", "Category", "Amount"]
+ROWS = [["01/0%d/2024" % day, "Work", "%d.00" % (day * 100)] for day in range(1, 6)]
+
+
+def read_csv(path):
+    with open(path, newline="", encoding="utf-8") as f:
+        return list(csv.reader(f))
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+
+
+class LedgerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.dir, "income_data.csv")
+        write_csv(self.csv_path, [HEADER] + ROWS)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def reopen(self):
+        # A fresh Ledger reads the files back, as a restarted app would
+        return Ledger(self.csv_path)
+
+    def test_missing_csv_is_re_exported_not_re_imported(self):
+        first = Ledger(self.csv_path)
+        first.add(["01/09/2024", "Misc", "12.00"])
+        os.rename(self.csv_path, self.csv_path + ".moved")
+
+        second = self.reopen()
+        second.add(["01/10/2024", "Refund", "5.00"])
+
+        self.assertEqual(len(second.rows()) - 1, len(ROWS) + 2)
+        on_disk = read_csv(self.csv_path)
+        self.assertEqual(on_disk[0], HEADER)
+        self.assertEqual(len(on_disk) - 1, len(ROWS) + 2)
+        self.assertEqual(len(self.reopen().rows()) - 1, len(ROWS) + 2)
+
+    def test_torn_journal_record_is_dropped(self):
+        first = Ledger(self.csv_path)
+        kept_id = first.add(["01/09/2024", "Misc", "12.00"])
+        with open(first.journal_path, "a", encoding="utf-8") as f:
+            f.write('{"seq": 99, "op": "add", "id": 99, "ro')  # crash mid-append
+
+        second = self.reopen()
+        self.assertEqual(second.get(kept_id), ["01/09/2024", "Misc", "12.00"])
+        with open(second.journal_path, "rb") as f:
+            self.assertTrue(f.read().endswith(b"\n"))
+
+        # The next append starts on a fresh line and survives another restart
+        new_id = second.add(["01/10/2024", "Refund", "5.00"])
+        third = self.reopen()
+        self.assertEqual(third.get(kept_id), ["01/09/2024", "Misc", "12.00"])
+        self.assertEqual(third.get(new_id), ["01/10/2024", "Refund", "5.00"])
+
+    def test_re_import_keeps_row_ids(self):
+        first = Ledger(self.csv_path)
+        ids = {tuple(row): row.row_id for row in first.rows()[1:]}
+        first.delete(ids[tuple(ROWS[0])])
+        first.flush()
+
+        external = ["01/11/2024", "Misc", "40.00"]
+        with open(self.csv_path, "a", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(external)
+        data = first.rows()  # picks up the outside append
+
+        reimported = {tuple(row): row.row_id for row in data[1:]}
+        for row in ROWS[1:]:
+            self.assertEqual(reimported[tuple(row)], ids[tuple(row)])
+        self.assertNotIn(reimported[tuple(external)], ids.values())
+
+    def test_external_edit_over_unexported_edits_is_kept_aside(self):
+        first = Ledger(self.csv_path)
+        row_id = first.rows()[1].row_id
+        first.edit(row_id, ["01/01/2024", "Work", "150.00"])  # not exported until flush
+
+        external = [HEADER] + ROWS + [["01/11/2024", "Misc", "40.00"]]
+        write_csv(self.csv_path, external)
+        os.utime(self.csv_path, ns=(0, 10**18))  # a stamp that differs from the export
+        data = first.rows()
+
+        self.assertEqual(data[1], ["01/01/2024", "Work", "150.00"])
+        copies = [name for name in os.listdir(self.dir) if ".external-" in name]
+        self.assertEqual(len(copies), 1)
+        self.assertEqual(read_csv(os.path.join(self.dir, copies[0])), external)
+
+
+if __name__ == "__main__":
+    unittest.main()
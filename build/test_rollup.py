@@ -0,0 +1,107 @@
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from datetime import date
+from unittest import mock
+
+from ledger import Ledger
+from rollup import Rollup
+from tx_store import TransactionStore
+
+
+HEADER = ["Date", "Category", "Cost", "Necessity"]
+ROWS = [
+    ["01/05/2023", "Food", "12.50", "Yes"],
+    ["01/20/2023", "Games", "60.00", "No"],
+    ["02/03/2023", "Food", "8.25", "Yes"],
+    ["12/30/2023", "Travel", "300.00", "No"],
+    ["01/02/2024", "Games", "15.00", "No"],
+    ["01/15/2024", "Food", "40.00", "Yes"],
+    ["not a date", "Food", "1.00", "Yes"],
+]
+MONTHS = [(2023, 1), (2023, 2), (2023, 12), (2024, 1), (2024, 2)]
+
+
+def write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        csv.writer(f).writerows(rows)
+
+
+def month_range(year, month):
+    return date(year, month, 1), date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+
+
+class RollupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.mkdtemp()
+        self.csv_path = os.path.join(self.dir, "expenses_data.csv")
+        write_csv(self.csv_path, [HEADER] + ROWS)
+        self.ledger = Ledger(self.csv_path)
+        self.rollup = Rollup(self.ledger)
+
+    def tearDown(self):
+        shutil.rmtree(self.dir, ignore_errors=True)
+
+    def assert_matches_store(self):
+        data = self.ledger.rows()
+        self.assertTrue(self.rollup.in_sync_with(data))
+        store = TransactionStore(data)
+        for year, month in MONTHS:
+            expected = store.spending_by_category(*month_range(year, month))
+            actual = self.rollup.category_totals("month", f"{year}-{month:02d}")
+            self.assertEqual(set(actual), set(expected))
+            for category, total in expected.items():
+                self.assertAlmostEqual(actual[category], total)
+        for non_necessity_only, necessity in ((False, None), (True, "No")):
+            expected = store.totals_by_year(non_necessity_only)
+            actual = {int(year): total for year, total in self.rollup.period_totals("year", necessity).items()}
+            for year in set(actual) | set(expected):
+                self.assertAlmostEqual(actual.get(year, 0), expected.get(year, 0))
+
+    def test_initial_build(self):
+        self.assert_matches_store()
+
+    def test_add_edit_delete(self):
+        new_id = self.ledger.add(["02/10/2024", "Games", "20.00", "No"])
+        self.assert_matches_store()
+
+        self.ledger.edit(new_id, ["02/11/2024", "Travel", "25.00", "No"])
+        self.assert_matches_store()
+
+        first_id = self.ledger.rows()[1].row_id
+        self.ledger.delete(first_id)
+        self.assert_matches_store()
+
+    def test_replace_all(self):
+        self.ledger.replace_all(HEADER, ROWS[:3] + [["02/01/2024", "Food", "9.00", "Yes"]])
+        self.assertFalse(self.rollup.in_sync_with(self.ledger.rows()))
+        self.rollup.rebuild()  # as rollup_for does for a stale rollup
+        self.assert_matches_store()
+
+    def test_outside_csv_edit(self):
+        self.ledger.flush()
+        write_csv(self.csv_path, [HEADER] + ROWS + [["02/20/2024", "Food", "5.00", "No"]])
+        os.utime(self.csv_path, ns=(0, 10**18))  # a stamp that differs from the export
+        self.assertTrue(self.ledger.refresh())
+        self.assertFalse(self.rollup.in_sync_with(self.ledger.rows()))
+
+        # Edits made before the recount are picked up by it, not applied twice
+        self.ledger.add(["02/21/2024", "Games", "7.00", "No"])
+        self.rollup.rebuild()
+        self.assert_matches_store()
+
+    def test_reopen_loads_saved_cube(self):
+        self.ledger.add(["02/10/2024", "Games", "20.00", "No"])
+        self.rollup.save()
+
+        self.ledger = Ledger(self.csv_path)
+        with mock.patch.object(Rollup, "rebuild", side_effect=AssertionError("rebuilt")):
+            self.rollup = Rollup(self.ledger)
+        self.assert_matches_store()
+
+
+if __name__ == "__main__":
+    unittest.main()
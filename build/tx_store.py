@@ -0,0 +1,320 @@
+import math
+from array import array
+from bisect import bisect_left
+from datetime import date, datetime
+
+from lru import LRUCache
+
+
+DATE_FORMAT = '%m/%d/%Y'
+
+# How many parsed stores get_store keeps around for recently loaded data lists
+STORE_CACHE_SIZE = 8
+
+
+def find_column(header, name):
+    """Index of name in header, also accepting its lower-case spelling; -1 when missing."""
+    for candidate in (name, name.lower()):
+        if candidate in header:
+            return header.index(candidate)
+    return -1
+
+
+def parse_amount(value):
+    return float(str(value).replace('$', '').replace(',', '').strip())
+
+
+def ordinal_ceil(value):
+    """First day ordinal that is >= value, for datetimes that may carry a time of day."""
+    ordinal = value.toordinal()
+    if isinstance(value, datetime) and value.time() != datetime.min.time():
+        ordinal += 1
+    return ordinal
+
+
+class TransactionStore:
+    """Typed, column-oriented copy of one CSV data list ([header] + rows).
+
+    Dates are stored as day ordinals sorted ascending, with categories as integer
+    codes and amounts as floats, so range queries are two binary searches over
+    the date column. `positions` maps each sorted slot back to its row in data[1:].
+    Rows whose date does not parse are left out of the index.
+    """
+
+    def __init__(self, data, date_col="Date", category_col="Category", amount_col="Cost",
+                 necessity_col="Necessity"):
+        header = data[0] if data else []
+        self.date_index = find_column(header, date_col)
+        self.category_index = find_column(header, category_col)
+        self.amount_index = find_column(header, amount_col)
+        self.necessity_index = find_column(header, necessity_col)
+
+        self.categories = []  # code -> category name
+        self.category_codes = {}  # category name -> code
+        self.ordinals = array('l')
+        self.codes = array('l')
+        self.amounts = array('d')
+        self.non_necessity = array('b')  # 1 when the row's Necessity is "No"
+        self.positions = array('l')
+        self.bad_dates = 0
+        self.bad_amounts = 0
+
+        if self.date_index != -1 and data:
+            self._build(data[1:])
+
+    def _build(self, rows):
+        parsed_dates = {}  # each distinct date string is parsed once
+        entries = []
+        for position, row in enumerate(rows):
+            try:
+                date_str = row[self.date_index]
+            except IndexError:
+                self.bad_dates += 1
+                continue
+            ordinal = parsed_dates.get(date_str)
+            if ordinal is None:
+                try:
+                    ordinal = datetime.strptime(date_str, DATE_FORMAT).toordinal()
+                except ValueError:
+                    ordinal = -1
+                parsed_dates[date_str] = ordinal
+            if ordinal == -1:
+                self.bad_dates += 1
+                continue
+
+            code = -1
+            if self.category_index != -1 and self.category_index < len(row):
+                category = row[self.category_index].strip()
+                code = self.category_codes.get(category)
+                if code is None:
+                    code = len(self.categories)
+                    self.category_codes[category] = code
+                    self.categories.append(category)
+
+            amount = math.nan
+            if self.amount_index != -1:
+                try:
+                    amount = parse_amount(row[self.amount_index])
+                except (ValueError, IndexError):
+                    self.bad_amounts += 1
+
+            not_needed = 0
+            if self.necessity_index != -1 and self.necessity_index < len(row):
+                not_needed = 1 if row[self.necessity_index].lower() == "no" else 0
+
+            entries.append((ordinal, position, code, amount, not_needed))
+
+        entries.sort()
+        for ordinal, position, code, amount, not_needed in entries:
+            self.ordinals.append(ordinal)
+            self.positions.append(position)
+            self.codes.append(code)
+            self.amounts.append(amount)
+            self.non_necessity.append(not_needed)
+
+        if self.bad_dates:
+            print(f"Warning: Could not parse {self.bad_dates} date(s)")
+        if self.bad_amounts:
+            print(f"Warning: Could not parse {self.bad_amounts} amount(s)")
+
+    def __len__(self):
+        return len(self.ordinals)
+
+    def range_slice(self, start_date, end_date):
+        """(lo, hi) slots of rows with start_date <= date < end_date."""
+        lo = bisect_left(self.ordinals, ordinal_ceil(start_date))
+        hi = bisect_left(self.ordinals, ordinal_ceil(end_date), lo)
+        return lo, hi
+
+    def spending_by_category(self, start_date, end_date, non_necessity_only=False):
+        lo, hi = self.range_slice(start_date, end_date)
+        totals = {}
+        first_seen = {}
+        codes, amounts, not_needed, positions = self.codes, self.amounts, self.non_necessity, self.positions
+        for i in range(lo, hi):
+            amount = amounts[i]
+            code = codes[i]
+            if code == -1 or amount != amount:  # no category or NaN amount
+                continue
+            if non_necessity_only and not not_needed[i]:
+                continue
+            totals[code] = totals.get(code, 0) + amount
+            if code not in first_seen or positions[i] < first_seen[code]:
+                first_seen[code] = positions[i]
+        # Keep categories in file order, like the row-by-row scan this replaces
+        return {self.categories[code]: totals[code] for code in sorted(totals, key=first_seen.get)}
+
+    def total(self, start_date, end_date, non_necessity_only=False):
+        lo, hi = self.range_slice(start_date, end_date)
+        total = 0
+        for i in range(lo, hi):
+            amount = self.amounts[i]
+            if amount == amount and (not non_necessity_only or self.non_necessity[i]):
+                total += amount
+        return total
+
+    def totals_by_year(self, non_necessity_only=False):
+        """{year: total} over every indexed row, years ascending."""
+        totals = {}
+        for year in sorted({int(y) for y in self.years()}):
+            totals[year] = self.total(date(year, 1, 1), date(year + 1, 1, 1), non_necessity_only)
+        return totals
+
+    def _distinct_dates(self):
+        distinct = []
+        last = None
+        for ordinal in self.ordinals:
+            if ordinal != last:
+                distinct.append(date.fromordinal(ordinal))
+                last = ordinal
+        return distinct
+
+    def months(self):
+        return sorted({d.strftime('%Y-%m') for d in self._distinct_dates()}, reverse=True)
+
+    def years(self):
+        return sorted({str(d.year) for d in self._distinct_dates()}, reverse=True)
+
+    def weeks(self):
+        weeks = set()
+        for d in self._distinct_dates():
+            year, week, _ = d.isocalendar()
+            weeks.add(f'{year}-W{week:02d}')
+        return sorted(weeks, reverse=True)
+
+
+_stores = LRUCache(STORE_CACHE_SIZE)  # charts build stores on the worker pool
+
+
+def get_store(data, date_col="Date", category_col="Category", amount_col="Cost", necessity_col="Necessity"):
+    """Return the TransactionStore for a data list, building it once per loaded list."""
+    key = (id(data), len(data), date_col, category_col, amount_col, necessity_col)
+    cached = _stores.get(key)
+    # The data list is kept alongside the store so its id can't be reused while cached
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    store = TransactionStore(data, date_col, category_col, amount_col, necessity_col)
+    _stores.put(key, (data, store))
+    return store
+
+
+SORT_OPTIONS = [
+    "Date: Most Recent to Least Recent",
+    "Date: Least Recent to Most Recent",
+    "Price: High to Low",
+    "Price: Low to High",
+]
+
+
+class SortIndex:
+    """Precomputed sort keys, category index and cached views for one data list.
+
+    Date ordinals and numeric amounts are parsed once; each sort option's permutation
+    and each (sort, category) view is computed once and reused. Views are lists of
+    indices into data[1:]; a new one may be computed on the worker pool.
+    """
+
+    def __init__(self, data, category_col="Category", amount_cols=("Cost", "Amount"), date_col="Date"):
+        header = data[0] if data else []
+        rows = data[1:] if data else []
+        date_index = find_column(header, date_col)
+        category_index = find_column(header, category_col)
+        amount_index = -1
+        for amount_col in amount_cols:
+            amount_index = find_column(header, amount_col)
+            if amount_index != -1:
+                break
+
+        parsed_dates = {}
+        self.date_keys = []
+        self.amount_keys = []
+        self.category_rows = {}  # category -> row indices in file order
+        bad_amounts = 0
+        for i, row in enumerate(rows):
+            ordinal = 0  # unparsable dates sort like datetime.min, as in sort_data_by_date
+            if date_index != -1 and date_index < len(row):
+                date_str = row[date_index]
+                ordinal = parsed_dates.get(date_str)
+                if ordinal is None:
+                    try:
+                        ordinal = datetime.strptime(date_str, DATE_FORMAT).toordinal()
+                    except ValueError:
+                        ordinal = 0
+                    parsed_dates[date_str] = ordinal
+            self.date_keys.append(ordinal)
+
+            amount = None  # no valid price; sorts last in both price orders
+            if amount_index != -1:
+                try:
+                    amount = parse_amount(row[amount_index])
+                except (ValueError, IndexError):
+                    bad_amounts += 1
+            self.amount_keys.append(amount)
+
+            if category_index != -1 and category_index < len(row):
+                self.category_rows.setdefault(row[category_index], []).append(i)
+
+        if bad_amounts:
+            print(f"Warning: {bad_amounts} row(s) have no valid price and sort last")
+
+        # Display width per column (8 pixels per char, at least 100), measured once
+        self.column_widths = [len(name) * 8 for name in header]
+        for row in rows:
+            for i, cell_value in enumerate(row[:len(header)]):
+                width = len(str(cell_value)) * 8
+                if width > self.column_widths[i]:
+                    self.column_widths[i] = width
+        self.column_widths = [max(100, width) for width in self.column_widths]
+
+        self.size = len(rows)
+        self._permutations = {}
+        self._views = {}
+
+    def permutation(self, sort_option):
+        order = self._permutations.get(sort_option)
+        if order is not None:
+            return order
+        indices = range(self.size)
+        if sort_option == "Date: Least Recent to Most Recent":
+            order = self.permutation("Date: Most Recent to Least Recent")[::-1]
+        elif sort_option == "Price: High to Low":
+            amounts = self.amount_keys
+            order = sorted(indices, key=lambda i: (amounts[i] is not None, amounts[i] or 0.0), reverse=True)
+        elif sort_option == "Price: Low to High":
+            amounts = self.amount_keys
+            order = sorted(indices, key=lambda i: (amounts[i] is None, amounts[i] or 0.0))
+        else:
+            order = sorted(indices, key=self.date_keys.__getitem__, reverse=True)
+        self._permutations[sort_option] = order
+        return order
+
+    def cached_view(self, sort_option, category="All"):
+        """The view if it has already been computed, else None."""
+        return self._views.get((sort_option, category))
+
+    def view(self, sort_option, category="All"):
+        """Row indices for one sort option, limited to a category unless it is "All"."""
+        key = (sort_option, category)
+        order = self._views.get(key)
+        if order is not None:
+            return order
+        order = self.permutation(sort_option)
+        if category != "All":
+            members = set(self.category_rows.get(category, ()))
+            order = [i for i in order if i in members]
+        self._views[key] = order
+        return order
+
+
+_sort_indexes = LRUCache(STORE_CACHE_SIZE)  # indexes are built on the worker pool
+
+
+def get_sort_index(data):
+    """Return the SortIndex for a data list, building it once per loaded list."""
+    key = (id(data), len(data))
+    cached = _sort_indexes.get(key)
+    if cached is not None and cached[0] is data:
+        return cached[1]
+    index = SortIndex(data)
+    _sort_indexes.put(key, (data, index))
+    return index
@@ -0,0 +1,215 @@
+import tkinter as tk
+from tkinter import ttk
+
+from background import run_in_background
+from ledger import LedgerRow
+from tx_store import get_sort_index
+
+
+# Rows materialized beyond the visible ones, so keyboard moves don't hit an empty edge
+BUFFER_ROWS = 20
+
+DEFAULT_ROW_HEIGHT = 20
+
+
+class VirtualTreeview(ttk.Treeview):
+    """Treeview that only holds the visible slice of a large row list.
+
+    The full rows live in self.rows and the current filter/sort as self.order (indices
+    into rows). Only order[first:first + visible + BUFFER_ROWS] are inserted as items;
+    scrolling moves `first` and swaps that slice. Sort keys, category indexes and
+    column widths come from a tx_store.SortIndex built on the worker pool.
+
+    Selection and focus are kept as row indices, so they survive the slice being
+    swapped out. delete() and item(values=...) keep self.rows in step, so the existing
+    edit/delete callbacks can keep working on the widget as if it were a plain Treeview.
+    """
+
+    def __init__(self, master, buffer=BUFFER_ROWS, **kw):
+        super().__init__(master, **kw)
+        self.buffer = buffer
+        self.data = None
+        self.header = []
+        self.rows = []
+        self.order = []
+        self.first = 0
+        self.index = None
+        self.removed = set()
+        self.selected_rows = set()  # row indices, including ones scrolled out of the slice
+        self.focus_row = None
+        self._iids = {}  # item id -> row index, for the materialized slice
+        self._pending_view = None
+        self._requested_view = None
+        self.scrollbar = ttk.Scrollbar(master, orient="vertical", command=self._on_scrollbar)
+
+        self.bind("<MouseWheel>", self._on_mousewheel)
+        self.bind("<Button-4>", lambda event: self.scroll(-3))
+        self.bind("<Button-5>", lambda event: self.scroll(3))
+        self.bind("<Configure>", lambda event: self._render())
+        self.bind("<<TreeviewSelect>>", lambda event: self._on_select())
+        self.bind("<Down>", lambda event: self._on_arrow(1))
+        self.bind("<Up>", lambda event: self._on_arrow(-1))
+        self.bind("<Next>", lambda event: self.scroll(self.visible_count()))
+        self.bind("<Prior>", lambda event: self.scroll(-self.visible_count()))
+
+    # --- Data ---
+
+    def load(self, data):
+        """Show data ([header] + rows) in file order and index it in the background."""
+        self.data = data
+        self.header = list(data[0]) if data else []
+        self.rows = list(data[1:]) if data else []
+        self.order = list(range(len(self.rows)))
+        self.removed = set()
+        self.selected_rows = set()
+        self.focus_row = None
+        self.index = None
+        self._requested_view = None
+        self.first = 0
+        self._render()
+        if data and len(data) > 1:
+            run_in_background(self, get_sort_index, lambda index: self._on_index_ready(data, index), data)
+
+    def _on_index_ready(self, data, index):
+        if data is not self.data:
+            return  # A newer data set was loaded meanwhile
+        self.index = index
+        for col, width in zip(self.header, index.column_widths):
+            self.column(col, width=width, anchor=tk.CENTER)
+        if self._pending_view is not None:
+            self.show_view(*self._pending_view)
+
+    def show_view(self, sort_option, category="All"):
+        """Switch to a sort/filter view; applied once the index and the view are ready."""
+        if self.index is None:
+            self._pending_view = (sort_option, category)
+            return
+        self._pending_view = None
+        requested = (self.index, sort_option, category)
+        self._requested_view = requested
+        order = self.index.cached_view(sort_option, category)
+        if order is None:
+            # Sorting or filtering a large history takes seconds; do it on the worker pool
+            run_in_background(self, self.index.view, lambda order: self._on_view_ready(requested, order),
+                              sort_option, category)
+            return
+        self._apply_view(order)
+
+    def _on_view_ready(self, requested, order):
+        if requested != self._requested_view:
+            return  # Another view was asked for, or new data loaded, while this one was computed
+        self._apply_view(order)
+
+    def _apply_view(self, order):
+        if self.removed:
+            order = [i for i in order if i not in self.removed]
+        self.order = order
+        self.first = 0
+        self._render()
+
+    # --- Rendering ---
+
+    def row_height(self):
+        height = ttk.Style(self).lookup("Treeview", "rowheight")
+        try:
+            return int(height) or DEFAULT_ROW_HEIGHT
+        except (TypeError, ValueError):
+            return DEFAULT_ROW_HEIGHT
+
+    def visible_count(self):
+        # One row's worth of height goes to the heading
+        return max(1, self.winfo_height() // self.row_height() - 1)
+
+    def _iid(self, index, row):
+        row_id = getattr(row, "row_id", None)
+        return str(row_id) if row_id is not None else f"row{index}"
+
+    def _selected_in_slice(self):
+        return {self._iids[iid] for iid in self.selection() if iid in self._iids}
+
+    def _on_select(self):
+        # Also fires, later, for the selection _render puts back; only a change the user
+        # made differs from the stored rows in the slice, and it replaces them
+        shown = self._selected_in_slice()
+        if shown != self.selected_rows & set(self._iids.values()):
+            self.selected_rows = shown
+
+    def _render(self):
+        self._on_select()  # in case the user's change hasn't been delivered yet
+        focus = self.focus()
+        if focus in self._iids:
+            self.focus_row = self._iids[focus]
+        super().delete(*self.get_children())
+        self._iids = {}
+        visible = self.visible_count()
+        self.first = max(0, min(self.first, len(self.order) - visible))
+        end = min(len(self.order), self.first + visible + self.buffer)
+        for position in range(self.first, end):
+            index = self.order[position]
+            row = self.rows[index]
+            iid = self._iid(index, row)
+            self._iids[iid] = index
+            super().insert("", tk.END, iid=iid, values=row)
+        # Deleting the items cleared focus and selection; without focus the arrow keys stop
+        rows_iids = {index: iid for iid, index in self._iids.items()}
+        keep = [rows_iids[index] for index in self.selected_rows if index in rows_iids]
+        if keep:
+            self.selection_set(keep)
+        if self.focus_row in rows_iids:
+            self.focus(rows_iids[self.focus_row])
+        self._update_scrollbar(visible)
+
+    def _update_scrollbar(self, visible):
+        total = len(self.order)
+        if total == 0:
+            self.scrollbar.set(0, 1)
+            return
+        self.scrollbar.set(self.first / total, min(1.0, (self.first + visible) / total))
+
+    def scroll(self, rows):
+        self.first += rows
+        self._render()
+        return "break"
+
+    def _on_mousewheel(self, event):
+        return self.scroll(-3 if event.delta > 0 else 3)
+
+    def _on_arrow(self, step):
+        # Let the Treeview move inside the slice; page the slice when leaving the visible part
+        focus = self.focus()
+        if focus in self._iids:
+            position = self.get_children().index(focus)
+            if (step > 0 and position + 1 >= self.visible_count()) or (step < 0 and position == 0):
+                self.scroll(step)
+        return None
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self.first = int(float(amount) * len(self.order))
+            self._render()
+        elif action == "scroll":
+            step = int(amount) * (self.visible_count() if unit == "pages" else 1)
+            self.scroll(step)
+
+    # --- Keep rows in step with edits made through the widget ---
+
+    def delete(self, *items):
+        for item in items:
+            for iid in (item if isinstance(item, (tuple, list)) else (item,)):
+                index = self._iids.pop(iid, None)
+                if index is not None:
+                    self.removed.add(index)
+                    self.selected_rows.discard(index)
+                    if self.focus_row == index:
+                        self.focus_row = None
+                    self.order = [i for i in self.order if i != index]
+        super().delete(*items)
+
+    def item(self, item, option=None, **kw):
+        if "values" in kw:
+            iid = item[0] if isinstance(item, (tuple, list)) else item
+            index = self._iids.get(iid)
+            if index is not None:
+                row = self.rows[index]
+                self.rows[index] = LedgerRow(kw["values"], getattr(row, "row_id", None))
+        return super().item(item, option, **kw)